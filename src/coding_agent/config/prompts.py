@@ -6,8 +6,36 @@ in the autonomous coding workflow. Each prompt is designed to produce
 consistent, high-quality results for specific coding tasks.
 """
 
+import functools
+from string import Formatter
+from typing import Dict, Any, Tuple
+
 from langchain_core.prompts import PromptTemplate
-from typing import Dict, Any
+
+
+@functools.lru_cache(maxsize=None)
+def _parsed_segments(template: str) -> Tuple:
+    """Parse a format-string template into (literal, field, spec, conv)
+    segments, once per distinct template."""
+    return tuple(Formatter().parse(template))
+
+
+class _PrecompiledPromptTemplate(PromptTemplate):
+    """PromptTemplate that renders by joining pre-parsed segments.
+
+    The stock format() walks the str.format parser over the full
+    multi-kilobyte template on every render; these prompts are rendered
+    on every agent call, so the parse is paid once instead.
+    """
+
+    def format(self, **kwargs: Any) -> str:
+        parts = []
+        for literal, field, spec, _conversion in _parsed_segments(self.template):
+            parts.append(literal)
+            if field is not None:
+                value = kwargs[field]
+                parts.append(format(value, spec) if spec else str(value))
+        return "".join(parts)
 
 
 # =============================================================================
@@ -87,7 +115,7 @@ Please provide a comprehensive analysis and implementation plan with the followi
 Provide your analysis in a structured JSON format with clear sections.
 """
 
-PLANNER_PROMPT = PromptTemplate(
+PLANNER_PROMPT = _PrecompiledPromptTemplate(
     input_variables=["target_service", "repo_structure", "existing_patterns", "requirements", "context"],
     template=PLANNER_ANALYSIS_TEMPLATE
 )
@@ -168,7 +196,7 @@ Please generate the complete, production-ready code for the specified file. Foll
 Please provide the complete file content, not just snippets. Include all necessary imports and ensure the code is ready to run.
 """
 
-CODER_PROMPT = PromptTemplate(
+CODER_PROMPT = _PrecompiledPromptTemplate(
     input_variables=["implementation_plan", "target_service", "existing_patterns", "repo_structure", "target_file", "changes_required"],
     template=CODER_IMPLEMENTATION_TEMPLATE
 )
@@ -262,7 +290,7 @@ Please generate a comprehensive test suite that covers:
 Please provide the complete test file with all necessary imports and fixtures.
 """
 
-TESTER_PROMPT = PromptTemplate(
+TESTER_PROMPT = _PrecompiledPromptTemplate(
     input_variables=["code_content", "target_service", "feature_description", "api_endpoints"],
     template=TESTER_TEMPLATE
 )
@@ -339,7 +367,7 @@ Please analyze the provided codebase and extract the following patterns:
 Provide your analysis in a structured format that can guide code generation to match existing patterns.
 """
 
-CODE_ANALYSIS_PROMPT = PromptTemplate(
+CODE_ANALYSIS_PROMPT = _PrecompiledPromptTemplate(
     input_variables=["repository_name", "service_name", "code_samples", "file_structure"],
     template=CODE_ANALYSIS_TEMPLATE
 )
@@ -419,11 +447,21 @@ Provide your validation result as:
 - Overall quality score (1-10)
 """
 
-QUALITY_VALIDATION_PROMPT = PromptTemplate(
+QUALITY_VALIDATION_PROMPT = _PrecompiledPromptTemplate(
     input_variables=["code_content", "feature_description", "original_requirements", "target_service"],
     template=QUALITY_VALIDATION_TEMPLATE
 )
 
+# Built once at import; get_system_prompts used to assemble this dict
+# on every call.
+SYSTEM_PROMPTS: Dict[str, str] = {
+    "planner": PLANNER_SYSTEM_PROMPT,
+    "coder": CODER_SYSTEM_PROMPT,
+    "tester": TESTER_SYSTEM_PROMPT,
+    "code_analyzer": CODE_ANALYSIS_SYSTEM_PROMPT,
+    "quality_validator": QUALITY_VALIDATOR_SYSTEM_PROMPT
+}
+
 
 # =============================================================================
 # PROMPT REGISTRY
@@ -460,10 +498,4 @@ class PromptRegistry:
     @staticmethod
     def get_system_prompts() -> Dict[str, str]:
         """Get all system prompts for agent initialization."""
-        return {
-            "planner": PLANNER_SYSTEM_PROMPT,
-            "coder": CODER_SYSTEM_PROMPT,
-            "tester": TESTER_SYSTEM_PROMPT,
-            "code_analyzer": CODE_ANALYSIS_SYSTEM_PROMPT,
-            "quality_validator": QUALITY_VALIDATOR_SYSTEM_PROMPT
-        }
\ No newline at end of file
+        return SYSTEM_PROMPTS
\ No newline at end of file
@@ -51,8 +51,20 @@ class Settings(BaseSettings):
     github_token: str = Field(description="GitHub personal access token")
     target_repositories_raw: str = Field(description="Comma-separated list of target repositories", alias="TARGET_REPOSITORIES")
     
+    # Git settings
+    use_libgit2: bool = Field(default=True, description="Use in-process libgit2 (pygit2) when installed instead of spawning git subprocesses")
+
     # CORS settings
     cors_origins_raw: str = Field(description="Comma-separated list of CORS origins", alias="CORS_ORIGINS")
+
+    # Docker settings
+    docker_network_mode: str = Field(default="bridge", description="Network mode for test containers")
+    test_base_image: str = Field(default="coding-agent-test:base", description="Prebuilt image for test containers (docker/Dockerfile.test-base)")
+    docker_pool_size: int = Field(default=0, description="Number of pre-warmed test containers to keep ready")
+    warm_pool_size: int = Field(default=0, description="Number of ready test environments to recycle between tasks")
+    docker_max_concurrency: int = Field(default=32, description="Maximum concurrent Docker daemon operations")
+    pip_cache_host_dir: Optional[str] = Field(default=None, description="Host directory mounted into test containers as the shared pip cache (defaults to <workspace>/pip-cache)")
+    wheelhouse_host_dir: Optional[str] = Field(default=None, description="Host directory of pre-downloaded wheels mounted read-only into test containers; when set, container pip installs resolve offline from it")
     
     # Computed properties
     api_host: str = Field(default="0.0.0.0", description="API host address")
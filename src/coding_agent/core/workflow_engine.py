@@ -77,10 +77,17 @@ class WorkflowContext:
         # Error handling
         self.error_message: Optional[str] = None
         self.error_details: Optional[Dict[str, Any]] = None
-        
+
         # Statistics
         self.statistics: Dict[str, Any] = {}
-    
+
+        # Execution log lines, served separately from the status response
+        self.logs: List[str] = []
+
+    def add_log(self, message: str):
+        """Append a timestamped line to the execution log."""
+        self.logs.append(f"{datetime.utcnow().isoformat()} {message}")
+
     def add_workflow_step(
         self, 
         step_name: str, 
@@ -95,6 +102,7 @@ class WorkflowContext:
             details=details or {}
         )
         self.workflow_steps.append(step)
+        self.add_log(f"step started: {step_name}")
         self.updated_at = datetime.utcnow()
         return step
     
@@ -111,6 +119,7 @@ class WorkflowContext:
             step.duration_seconds = (step.completed_at - step.started_at).total_seconds()
         if error_message:
             step.error_message = error_message
+        self.add_log(f"step {status}: {step.step_name}")
         self.updated_at = datetime.utcnow()
     
     def update_progress(self, percentage: int):
@@ -123,6 +132,7 @@ class WorkflowContext:
         self.error_message = message
         self.error_details = details or {}
         self.current_state = WorkflowState.FAILED
+        self.add_log(f"error: {message}")
         self.updated_at = datetime.utcnow()
 
 
@@ -137,6 +147,12 @@ class WorkflowEngine:
     def __init__(self):
         self.settings = get_settings()
         self.active_workflows: Dict[str, WorkflowContext] = {}
+
+        # Completion signal per task: set when the background workflow
+        # task finishes (any terminal state), so callers can await the
+        # outcome instead of polling with fixed sleeps.
+        self._completion_events: Dict[str, asyncio.Event] = {}
+        self._milestone_events: Dict[str, Dict[WorkflowState, asyncio.Event]] = {}
         
         # Initialize AI services (import here to avoid circular imports)
         from ..agents.coding_agents import CodingAgentOrchestrator
@@ -201,7 +217,8 @@ class WorkflowEngine:
         
         # Store in active workflows
         self.active_workflows[task_id] = context
-        
+        self._completion_events[task_id] = asyncio.Event()
+
         # Start workflow execution in background
         asyncio.create_task(self._execute_workflow(context))
         
@@ -218,6 +235,17 @@ class WorkflowEngine:
             workflow_steps=[]
         )
     
+    def milestone(self, task_id: str, state: WorkflowState) -> asyncio.Event:
+        """Return the event set once the given state's handler completes.
+
+        Events are created on first access, so callers may await a
+        milestone before or after the workflow reaches it; waiting on
+        several concurrently costs max(stages) rather than sum(stages).
+        """
+        return self._milestone_events.setdefault(task_id, {}).setdefault(
+            state, asyncio.Event()
+        )
+
     async def get_task_status(self, task_id: str) -> Optional[TaskStatusResponse]:
         """Get the current status of a coding task."""
         context = self.active_workflows.get(task_id)
@@ -292,13 +320,15 @@ class WorkflowEngine:
                 context.update_progress(progress)
                 
                 # Get the handler for current state
-                handler = self.state_handlers.get(context.current_state)
+                current_state = context.current_state
+                handler = self.state_handlers.get(current_state)
                 if not handler:
-                    raise ValueError(f"No handler for state: {context.current_state}")
-                
+                    raise ValueError(f"No handler for state: {current_state}")
+
                 # Execute the state handler
                 try:
                     next_state = await handler(context)
+                    self.milestone(context.task_id, current_state).set()
                     if next_state:
                         context.current_state = next_state
                         logger.debug(f"Task {context.task_id} transitioned to {next_state}")
@@ -324,6 +354,11 @@ class WorkflowEngine:
         finally:
             # Cleanup resources
             await self._cleanup_workflow(context)
+
+            # Signal completion whatever the terminal state was
+            event = self._completion_events.get(context.task_id)
+            if event is not None:
+                event.set()
     
     # State handlers (placeholder implementations for Phase 1.1)
     
@@ -649,21 +684,17 @@ class WorkflowEngine:
                 implementation_type="feature"
             )
             
-            # Commit changes
-            commit_hash = await self.git_service.commit_changes(
+            # Commit and push in one call; the push is skipped when
+            # there was nothing to commit
+            commit_hash = await self.git_service.commit_and_push(
                 repo_path=context.workspace_path,
                 commit_message=commit_message,
+                branch_name=branch_name,
                 file_paths=files_changed
             )
             context.commit_hash = commit_hash
-            
-            # Push branch to remote
+
             if commit_hash:
-                await self.git_service.push_branch(
-                    repo_path=context.workspace_path,
-                    branch_name=branch_name
-                )
-                
                 context.statistics["git_operations_success"] = True
                 context.statistics["branch_pushed"] = True
                 
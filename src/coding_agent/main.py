@@ -12,21 +12,23 @@ This service provides:
 - Progress tracking and status monitoring
 """
 
+import json
 import logging
 import sys
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, List
 
 from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from contextlib import asynccontextmanager
 import uvicorn
 
 from .config.settings import get_settings, validate_settings
 from .models.requests import CodingRequest, TaskStatusRequest, HealthCheckRequest
 from .models.responses import (
-    CodingResponse, TaskStatusResponse, HealthResponse, 
+    CodingResponse, TaskStatusResponse, TaskStatusSummary, HealthResponse,
     ErrorResponse, TaskListResponse
 )
 from .core.workflow_engine import WorkflowEngine
@@ -150,6 +152,26 @@ app.add_middleware(
 )
 
 
+@lru_cache(maxsize=1)
+def _openapi_bytes() -> bytes:
+    """Encode the OpenAPI schema once; it is static after startup."""
+    return json.dumps(app.openapi(), separators=(",", ":")).encode("utf-8")
+
+
+# Replace the default /openapi.json route so the schema is served as
+# pre-encoded bytes instead of being dict-copied and re-serialized per request.
+app.router.routes = [
+    route for route in app.router.routes
+    if getattr(route, "path", None) != "/openapi.json"
+]
+
+
+@app.get("/openapi.json", include_in_schema=False)
+async def serve_openapi() -> Response:
+    """Serve the cached OpenAPI schema."""
+    return Response(content=_openapi_bytes(), media_type="application/json")
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler for better error responses."""
@@ -469,6 +491,43 @@ async def get_task_status(
         )
 
 
+@app.get("/api/v1/code/{task_id}/logs",
+    summary="Get Task Logs",
+    description="Stream the execution logs for a coding task as plain text"
+)
+async def get_task_logs(
+    task_id: str,
+    engine: WorkflowEngine = Depends(get_workflow_engine)
+) -> StreamingResponse:
+    """
+    📜 **Stream Task Execution Logs**
+
+    Logs can grow to thousands of lines, so they are served here as a
+    plain-text stream instead of being embedded in the JSON status
+    response. The stream yields the log in chunks as it is read.
+    """
+    context = engine.active_workflows.get(task_id)
+
+    if context is None:
+        # mode="json" so the timestamp is serialized; a raw datetime in
+        # the HTTPException detail turns the 404 into a 500
+        raise HTTPException(
+            status_code=404,
+            detail=ErrorResponse(
+                error="TaskNotFound",
+                message=f"Task with ID '{task_id}' not found",
+                timestamp=datetime.utcnow()
+            ).model_dump(mode="json")
+        )
+
+    async def log_stream(chunk_lines: int = 256):
+        logs = context.logs
+        for start in range(0, len(logs), chunk_lines):
+            yield "\n".join(logs[start:start + chunk_lines]) + "\n"
+
+    return StreamingResponse(log_stream(), media_type="text/plain")
+
+
 @app.delete("/api/v1/code/{task_id}",
     summary="Cancel Task",
     description="Cancel a running coding task"
@@ -540,14 +599,22 @@ async def list_tasks(
     - **Complete Information**: Full task details including progress and results
     """
     try:
-        # Get all tasks
+        # Get all tasks as lightweight summaries
         all_tasks = []
         for task_id in engine.active_workflows.keys():
             task_status = await engine.get_task_status(task_id)
             if task_status:
                 # Apply status filter if provided
                 if not status_filter or task_status.status.value == status_filter:
-                    all_tasks.append(task_status)
+                    all_tasks.append(TaskStatusSummary(
+                        task_id=task_status.task_id,
+                        status=task_status.status,
+                        progress_percentage=task_status.progress_percentage,
+                        current_step=task_status.current_step,
+                        updated_at=task_status.updated_at,
+                        branch_name=task_status.branch_name,
+                        pr_url=task_status.pr_url
+                    ))
         
         # Apply pagination
         total_count = len(all_tasks)
@@ -5,11 +5,29 @@ Defines all request models with validation and documentation
 for the autonomous coding workflow endpoints.
 """
 
+from types import MappingProxyType
 from typing import Optional, Dict, Any
 from pydantic import BaseModel, Field, validator
 from enum import Enum
 
 
+# Schema examples built once at import time and frozen so schema generation
+# shares a single structure instead of rebuilding the literal per Config body.
+_EXAMPLES: Dict[str, Dict[str, Any]] = MappingProxyType({
+    "CodingRequest": {
+        "example": {
+            "default_branch": "master",
+            "context": "This endpoint will be used to add two numbers",
+            "dry_run": False,
+            "priority": "medium",
+            "requirements": "Add a /api/v1/add endpoint that returns current timestamp, and the result of adding any two numbers",
+            "skip_tests": False,
+            "target_service": "market-predictor"
+        }
+    }
+})
+
+
 class Priority(str, Enum):
     """Priority levels for coding requests."""
     LOW = "low"
@@ -115,17 +133,7 @@ class CodingRequest(BaseModel):
         return v
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "default_branch": "master",
-                "context": "This endpoint will be used to add two numbers",
-                "dry_run": False,
-                "priority": "medium",
-                "requirements": "Add a /api/v1/add endpoint that returns current timestamp, and the result of adding any two numbers",
-                "skip_tests": False,
-                "target_service": "market-predictor"
-            }
-        }
+        json_schema_extra = _EXAMPLES["CodingRequest"]
 
 
 class TaskStatusRequest(BaseModel):
@@ -8,12 +8,113 @@ This module defines all data structures used in the testing infrastructure:
 - Test suite configurations
 """
 
+from types import MappingProxyType
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from enum import Enum
 from pydantic import BaseModel, Field
 
 
+# Schema examples built once at import time and frozen so schema generation
+# shares a single structure instead of rebuilding the literal per Config body.
+_EXAMPLES: Dict[str, Dict[str, Any]] = MappingProxyType({
+    "TestEnvironment": {
+        "example": {
+            "env_id": "test-env-task_abc123-def456",
+            "task_id": "task_abc123",
+            "container_id": "container_xyz789",
+            "status": "ready",
+            "target_service": "market-predictor",
+            "python_version": "3.9",
+            "dependencies_installed": True,
+            "service_started": False
+        }
+    },
+    "TestDetail": {
+        "example": {
+            "test_name": "test_api_endpoint_status",
+            "status": "passed",
+            "duration_seconds": 0.234,
+            "error_message": None
+        }
+    },
+    "TestResults": {
+        "example": {
+            "test_type": "unit",
+            "environment_id": "test-env-task_abc123-def456",
+            "passed": 8,
+            "failed": 0,
+            "skipped": 1,
+            "total": 9,
+            "coverage_percentage": 95.5,
+            "success": True,
+            "execution_time": 12.34
+        }
+    },
+    "TestSuite": {
+        "example": {
+            "test_type": "unit",
+            "test_files": {
+                "test_api.py": "import pytest\n\ndef test_endpoint():\n    assert True"
+            },
+            "pytest_args": ["-v", "--tb=short"],
+            "timeout_seconds": 300,
+            "coverage_threshold": 85.0
+        }
+    },
+    "CommandResult": {
+        "example": {
+            "exit_code": 0,
+            "stdout": "All tests passed",
+            "stderr": "",
+            "command": "pytest tests/",
+            "duration_seconds": 5.23,
+            "success": True
+        }
+    },
+    "ContainerInfo": {
+        "example": {
+            "container_id": "container_xyz789",
+            "env_id": "test-env-task_abc123-def456",
+            "name": "coding-agent-test-env-xyz",
+            "image": "python:3.9-slim",
+            "status": "running",
+            "memory_limit": "1g",
+            "cpu_limit": 1
+        }
+    },
+    "TestEnvironmentRequest": {
+        "example": {
+            "task_id": "task_abc123",
+            "target_service": "market-predictor",
+            "python_version": "3.9",
+            "additional_packages": ["redis", "celery"]
+        }
+    },
+    "TestExecutionRequest": {
+        "example": {
+            "environment_id": "test-env-task_abc123-def456",
+            "test_suite": {
+                "test_type": "unit",
+                "test_files": {
+                    "test_api.py": "test content"
+                }
+            }
+        }
+    },
+    "TestingServiceStatus": {
+        "example": {
+            "active_environments": 3,
+            "active_containers": 3,
+            "total_tests_run": 156,
+            "success_rate": 94.2,
+            "docker_available": True,
+            "service_healthy": True
+        }
+    }
+})
+
+
 class EnvironmentStatus(str, Enum):
     """Status of a test environment."""
     CREATING = "creating"
@@ -55,8 +156,11 @@ class TestEnvironment(BaseModel):
     # Runtime information
     container_info: Optional[Dict[str, Any]] = Field(default=None, description="Container runtime information")
     service_port: Optional[int] = Field(default=None, description="Service port if running")
+    service_startup_ms: Optional[float] = Field(default=None, description="Measured service startup time in milliseconds")
     dependencies_installed: bool = Field(default=False, description="Whether dependencies are installed")
+    base_image_prebaked: bool = Field(default=False, description="Whether the container image already bakes in the test toolchain")
     service_started: bool = Field(default=False, description="Whether target service is running")
+    snapshot_image: Optional[str] = Field(default=None, description="Snapshot image tag of the prepared container, if one was taken")
     
     # Lifecycle tracking
     created_at: Optional[datetime] = Field(default=None, description="Environment creation time")
@@ -67,18 +171,7 @@ class TestEnvironment(BaseModel):
     error_details: Optional[Dict[str, Any]] = Field(default=None, description="Detailed error information")
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "env_id": "test-env-task_abc123-def456",
-                "task_id": "task_abc123",
-                "container_id": "container_xyz789",
-                "status": "ready",
-                "target_service": "market-predictor",
-                "python_version": "3.9",
-                "dependencies_installed": True,
-                "service_started": False
-            }
-        }
+        json_schema_extra = _EXAMPLES["TestEnvironment"]
 
 
 class TestDetail(BaseModel):
@@ -91,14 +184,7 @@ class TestDetail(BaseModel):
     output: Optional[str] = Field(default=None, description="Test output")
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "test_name": "test_api_endpoint_status",
-                "status": "passed",
-                "duration_seconds": 0.234,
-                "error_message": None
-            }
-        }
+        json_schema_extra = _EXAMPLES["TestDetail"]
 
 
 class TestResults(BaseModel):
@@ -138,19 +224,7 @@ class TestResults(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional test metadata")
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "test_type": "unit",
-                "environment_id": "test-env-task_abc123-def456",
-                "passed": 8,
-                "failed": 0,
-                "skipped": 1,
-                "total": 9,
-                "coverage_percentage": 95.5,
-                "success": True,
-                "execution_time": 12.34
-            }
-        }
+        json_schema_extra = _EXAMPLES["TestResults"]
 
 
 class TestSuite(BaseModel):
@@ -175,17 +249,7 @@ class TestSuite(BaseModel):
     environment_variables: Optional[Dict[str, str]] = Field(default=None, description="Environment variables for tests")
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "test_type": "unit",
-                "test_files": {
-                    "test_api.py": "import pytest\n\ndef test_endpoint():\n    assert True"
-                },
-                "pytest_args": ["-v", "--tb=short"],
-                "timeout_seconds": 300,
-                "coverage_threshold": 85.0
-            }
-        }
+        json_schema_extra = _EXAMPLES["TestSuite"]
 
 
 class CommandResult(BaseModel):
@@ -203,16 +267,7 @@ class CommandResult(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional command metadata")
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "exit_code": 0,
-                "stdout": "All tests passed",
-                "stderr": "",
-                "command": "pytest tests/",
-                "duration_seconds": 5.23,
-                "success": True
-            }
-        }
+        json_schema_extra = _EXAMPLES["CommandResult"]
 
 
 class ContainerInfo(BaseModel):
@@ -238,17 +293,7 @@ class ContainerInfo(BaseModel):
     cpu_limit: Optional[int] = Field(default=None, description="CPU limit")
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "container_id": "container_xyz789",
-                "env_id": "test-env-task_abc123-def456",
-                "name": "coding-agent-test-env-xyz",
-                "image": "python:3.9-slim",
-                "status": "running",
-                "memory_limit": "1g",
-                "cpu_limit": 1
-            }
-        }
+        json_schema_extra = _EXAMPLES["ContainerInfo"]
 
 
 class TestEnvironmentRequest(BaseModel):
@@ -261,14 +306,7 @@ class TestEnvironmentRequest(BaseModel):
     additional_packages: Optional[List[str]] = Field(default=None, description="Additional packages")
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "task_id": "task_abc123",
-                "target_service": "market-predictor",
-                "python_version": "3.9",
-                "additional_packages": ["redis", "celery"]
-            }
-        }
+        json_schema_extra = _EXAMPLES["TestEnvironmentRequest"]
 
 
 class TestExecutionRequest(BaseModel):
@@ -278,17 +316,7 @@ class TestExecutionRequest(BaseModel):
     test_suite: TestSuite = Field(..., description="Test suite to execute")
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "environment_id": "test-env-task_abc123-def456",
-                "test_suite": {
-                    "test_type": "unit",
-                    "test_files": {
-                        "test_api.py": "test content"
-                    }
-                }
-            }
-        }
+        json_schema_extra = _EXAMPLES["TestExecutionRequest"]
 
 
 class TestingServiceStatus(BaseModel):
@@ -308,13 +336,4 @@ class TestingServiceStatus(BaseModel):
     disk_usage: Optional[str] = Field(default=None, description="Disk usage")
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "active_environments": 3,
-                "active_containers": 3,
-                "total_tests_run": 156,
-                "success_rate": 94.2,
-                "docker_available": True,
-                "service_healthy": True
-            }
-        } 
\ No newline at end of file
+        json_schema_extra = _EXAMPLES["TestingServiceStatus"] 
\ No newline at end of file
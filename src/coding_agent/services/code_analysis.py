@@ -5,9 +5,14 @@ This service analyzes target repositories to understand patterns,
 conventions, and structures that guide code generation.
 """
 
+import asyncio
+import mmap
 import os
 import logging
-from typing import Dict, Any, List, Optional
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Set, Tuple
 from pathlib import Path
 import ast
 import json
@@ -17,408 +22,678 @@ from ..config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Directories skipped by every analyzer during repository traversal
+_IGNORED_DIRS = frozenset({
+    '.git', '__pycache__', 'venv', 'node_modules', '.venv',
+    '.mypy_cache', '.pytest_cache', 'build', 'dist'
+})
+
+# Well-known file-name groups checked once per file during the walk;
+# frozensets give hashed O(1) membership instead of list scans.
+_CONFIG_FILES = frozenset({
+    'requirements.txt', 'pyproject.toml', 'setup.py', '.env', 'docker-compose.yml'
+})
+_MAIN_MODULES = frozenset({'main.py', 'app.py', '__init__.py'})
+_DOCKER_FILES = frozenset({'docker-compose.yml', 'Dockerfile'})
+
+# Root-level configuration candidates, in report order
+_ROOT_CONFIG_FILES = (
+    '.env', '.env.example', 'config.py', 'settings.py',
+    'docker-compose.yml', 'Dockerfile', 'pyproject.toml'
+)
+
+# Upper bound on concurrent file reads, to avoid exhausting descriptors
+_READ_CONCURRENCY = 32
+
+# Per-file analysis cache keyed on (path, st_mtime_ns, st_size); unchanged
+# files cost one stat on re-analysis instead of a read plus parse. Bounded
+# so a long-running service does not grow without limit.
+_FILE_CACHE: Dict[Tuple[str, int, int], Optional[Dict[str, Any]]] = {}
+_FILE_CACHE_MAX = 4096
+_FILE_CACHE_LOCK = asyncio.Lock()
+
+# Shared process pool for per-file parsing: ast.parse and the AST walk are
+# CPU-bound and hold the GIL, so threads serialize them; worker processes
+# give real parallelism. Created lazily and reused across analyses.
+_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    global _PROCESS_POOL
+    if _PROCESS_POOL is None:
+        _PROCESS_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _PROCESS_POOL
+
+
+# Compile flags for pattern-extraction parses: PyCF_OPTIMIZE_AST (3.13+)
+# folds constants and drops dead code before ast.walk, so there are fewer
+# nodes to visit; on older interpreters it degrades to a plain AST parse.
+_AST_FLAGS = ast.PyCF_ONLY_AST | getattr(ast, "PyCF_OPTIMIZE_AST", 0)
+
+# All framework/test/settings markers detected in one compiled-regex pass
+# per file; the named group of each match identifies the marker found.
+# Compiled for both str content and the bytes/mmap large-file path.
+_MARKER_PATTERN = (
+    r"(?P<fastapi>^(?:from fastapi|import fastapi)\b)"
+    r"|(?P<pytest>^import pytest\b)"
+    r"|(?P<unittest>^import unittest\b)"
+    r"|(?P<fixture>@pytest\.fixture)"
+    r"|(?P<async_test>async def test_)"
+    r"|(?P<mock>[Mm]ock)"
+    r"|(?P<base_settings>BaseSettings)"
+    r"|(?P<os_environ>os\.environ)"
+)
+_MARKER_RE = re.compile(_MARKER_PATTERN, re.MULTILINE)
+_MARKER_RE_B = re.compile(_MARKER_PATTERN.encode("ascii"), re.MULTILINE)
+
+# Files at least this large are scanned through a read-only mmap, so the
+# marker regex runs over the page cache without copying the file into a
+# decoded str first.
+_MMAP_THRESHOLD = 64 * 1024
+
+
+class _PatternVisitor(ast.NodeVisitor):
+    """
+    Collects naming, import and error-handling patterns from one AST.
+
+    NodeVisitor resolves the visit_* method once per node type, so nodes
+    that carry no pattern information cost a single dispatch instead of a
+    chain of isinstance checks; only container nodes recurse further.
+    """
+
+    def __init__(self, patterns: Dict[str, Any]):
+        self.patterns = patterns
+
+    def _record_function(self, node: ast.AST):
+        patterns = self.patterns
+        functions = patterns["naming_conventions"]["functions"]
+        if len(functions) < 64:
+            functions.add(node.name)
+
+        # Check for type hints; the flag is monotonic, so once set the
+        # per-argument annotation scan is skipped.
+        if not patterns["type_hints_usage"] and (
+                node.returns or any(arg.annotation for arg in node.args.args)):
+            patterns["type_hints_usage"] = True
+
+        # Check for docstrings; once the style is known there is nothing
+        # further to learn, so skip the lookup for every later function.
+        if (patterns["docstring_style"] == "unknown" and
+                ast.get_docstring(node, clean=False) is not None):
+            patterns["docstring_style"] = "triple_quotes"
+
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        self._record_function(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
+        self.patterns["async_patterns"] = True
+        self._record_function(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        classes = self.patterns["naming_conventions"]["classes"]
+        if len(classes) < 64:
+            classes.add(node.name)
+        self.generic_visit(node)
+
+    def visit_Import(self, node: ast.Import):
+        imports = self.patterns["import_patterns"]
+        if len(imports) < 64:
+            for alias in node.names:
+                imports.add(f"import {alias.name}")
+
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        imports = self.patterns["import_patterns"]
+        if node.module and len(imports) < 64:
+            imports.add(f"from {node.module}")
+
+    def visit_Try(self, node: ast.Try):
+        self.patterns["error_handling"]["try_except_block"] += 1
+        self.generic_visit(node)
+
+    def visit_Raise(self, node: ast.Raise):
+        self.patterns["error_handling"]["raise_exception"] += 1
+        self.generic_visit(node)
+
 
 class CodeAnalysisService:
     """
     Service for analyzing existing codebases to understand patterns and conventions.
-    
+
     This service examines target repositories to extract:
     - Project structure and organization
     - Coding patterns and conventions
     - API design patterns
     - Dependencies and integrations
     """
-    
+
     def __init__(self):
         self.settings = get_settings()
-    
+
     async def analyze_repository(self, repo_path: str) -> Dict[str, Any]:
         """
         Analyze a repository to extract patterns and conventions.
-        
+
+        The repository tree is walked exactly once; each Python file is
+        read and parsed a single time and its content is dispatched to
+        every analyzer, instead of one walk (and one read) per analyzer.
+
         Args:
             repo_path: Path to the repository to analyze
-            
+
         Returns:
             Analysis results with patterns and structure information
         """
-        try:
-            logger.info(f"Analyzing repository: {repo_path}")
-            
-            if not os.path.exists(repo_path):
-                raise ValueError(f"Repository path does not exist: {repo_path}")
-            
-            analysis = {
-                "repository_path": repo_path,
-                "structure": await self._analyze_structure(repo_path),
-                "patterns": await self._analyze_code_patterns(repo_path),
-                "dependencies": await self._analyze_dependencies(repo_path),
-                "api_patterns": await self._analyze_api_patterns(repo_path),
-                "test_patterns": await self._analyze_test_patterns(repo_path),
-                "configuration": await self._analyze_configuration(repo_path)
+        logger.info(f"Analyzing repository: {repo_path}")
+
+        if not os.path.exists(repo_path):
+            raise ValueError(f"Repository path does not exist: {repo_path}")
+
+        structure = {
+            "directories": [],
+            "python_files": [],
+            "test_files": [],
+            "config_files": [],
+            "main_modules": []
+        }
+        patterns = self._empty_patterns()
+        api_patterns = self._empty_api_patterns()
+        test_patterns = {
+            "test_framework": "unknown",
+            "test_structure": [],
+            "fixture_usage": False,
+            "mock_usage": False,
+            "async_tests": False
+        }
+        configuration = {
+            "config_files": [],
+            "environment_variables": [],
+            "settings_pattern": "unknown",
+            "docker_usage": False
+        }
+
+        # Single fused walk: collect structure and the set of Python
+        # files, then read (and parse) them concurrently so disk
+        # latency overlaps with AST parsing. DirEntry.stat() is served
+        # from the cached scandir data, so the cache key costs nothing.
+        py_entries: List[Tuple[str, bool, int, int]] = []
+
+        for root, files in self._walk_repository(repo_path):
+            rel_root = os.path.relpath(root, repo_path)
+            if rel_root != '.':
+                structure["directories"].append(rel_root)
+
+            for entry in files:
+                file = entry.name
+                file_path = os.path.join(rel_root, file) if rel_root != '.' else file
+                is_test_file = file.endswith('.py') and self._is_test_path(file, file_path)
+                self._collect_structure(file, file_path, structure, is_test_file)
+
+                if file.endswith('.py'):
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    py_entries.append((entry.path, is_test_file, st.st_mtime_ns, st.st_size))
+
+        results = await self._analyze_python_files(py_entries)
+
+        # The test and settings flags are monotonic: once every flag has
+        # reached its final value, stop scanning markers for them.
+        test_flags_done = False
+        settings_done = False
+
+        for (full_path, is_test_file, _mtime_ns, _size), partial in zip(py_entries, results):
+            if partial is None:
+                continue
+
+            self._merge_partial(partial, patterns, api_patterns)
+
+            if is_test_file and not test_flags_done:
+                self._scan_test_patterns(partial["markers"], test_patterns)
+                test_flags_done = (
+                    test_patterns["test_framework"] == "pytest"
+                    and test_patterns["fixture_usage"]
+                    and test_patterns["mock_usage"]
+                    and test_patterns["async_tests"]
+                )
+
+            if not settings_done:
+                self._scan_settings_pattern(partial["markers"], configuration)
+                settings_done = configuration["settings_pattern"] == "pydantic"
+
+        # Finalize pattern buckets into JSON-friendly lists; the sets
+        # were already deduplicated on insert so no extra pass is needed.
+        patterns["naming_conventions"]["functions"] = sorted(patterns["naming_conventions"]["functions"])[:10]
+        patterns["naming_conventions"]["classes"] = sorted(patterns["naming_conventions"]["classes"])[:10]
+        patterns["import_patterns"] = sorted(patterns["import_patterns"])[:20]
+        patterns["error_handling"] = dict(patterns["error_handling"])
+
+        self._collect_config_files(repo_path, configuration)
+
+        analysis = {
+            "repository_path": repo_path,
+            "structure": structure,
+            "patterns": patterns,
+            "dependencies": self._analyze_dependencies(repo_path),
+            "api_patterns": api_patterns,
+            "test_patterns": test_patterns,
+            "configuration": configuration,
+            # Scalar counts recorded here so summaries need no len() calls
+            "counts": {
+                "python_files": len(structure["python_files"]),
+                "test_files": len(structure["test_files"]),
+                "endpoint_patterns": len(api_patterns["endpoint_patterns"])
             }
-            
-            logger.info("Repository analysis completed successfully")
-            return analysis
-            
-        except Exception as e:
-            logger.error(f"Error analyzing repository: {str(e)}")
-            raise Exception(f"Failed to analyze repository: {str(e)}")
-    
-    async def _analyze_structure(self, repo_path: str) -> Dict[str, Any]:
-        """Analyze the project structure and organization."""
+        }
+
+        logger.info("Repository analysis completed successfully")
+        return analysis
+
+    def _walk_repository(self, repo_path: str):
+        """
+        Traverse the repository with os.scandir instead of os.walk.
+
+        Yields (directory, file entries) pairs; DirEntry objects cache
+        their type information so no extra stat call is needed per file,
+        and ignored directories are pruned with an O(1) frozenset lookup.
+        """
+        stack = [repo_path]
+
+        while stack:
+            current = stack.pop()
+            files = []
+
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not entry.name.startswith('.') and entry.name not in _IGNORED_DIRS:
+                                stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            files.append(entry)
+            except OSError as e:
+                logger.debug(f"Could not scan {current}: {str(e)}")
+                continue
+
+            yield current, files
+
+    @staticmethod
+    def _empty_patterns() -> Dict[str, Any]:
+        """Fresh pattern buckets; sets deduplicate on insert, Counter tallies."""
+        return {
+            "naming_conventions": {
+                "functions": set(),
+                "classes": set(),
+                "variables": []
+            },
+            "import_patterns": set(),
+            "docstring_style": "unknown",
+            "type_hints_usage": False,
+            "async_patterns": False,
+            "error_handling": Counter()
+        }
+
+    @staticmethod
+    def _empty_api_patterns() -> Dict[str, Any]:
+        """Fresh API pattern buckets."""
+        return {
+            "endpoint_patterns": [],
+            "response_models": [],
+            "request_models": [],
+            "status_codes": [],
+            "middleware_usage": False,
+            "dependency_injection": False
+        }
+
+    async def _analyze_python_files(
+        self, py_entries: List[Tuple[str, bool, int, int]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Produce per-file analysis partials concurrently, with caching.
+
+        Each file's partial result is cached by (path, mtime_ns, size), so
+        re-analyzing an unchanged tree skips the read and parse entirely.
+        Cache misses are farmed out to worker processes for real CPU
+        parallelism on the parse and AST walk.
+        """
+        semaphore = asyncio.Semaphore(_READ_CONCURRENCY)
+        loop = asyncio.get_running_loop()
+        pool = _get_process_pool()
+
+        async def analyze_one(full_path: str, is_test_file: bool, mtime_ns: int, size: int):
+            key = (full_path, mtime_ns, size)
+            async with _FILE_CACHE_LOCK:
+                if key in _FILE_CACHE:
+                    return _FILE_CACHE[key]
+
+            async with semaphore:
+                partial = await loop.run_in_executor(
+                    pool, _analyze_file_worker, full_path, is_test_file
+                )
+
+            async with _FILE_CACHE_LOCK:
+                if len(_FILE_CACHE) >= _FILE_CACHE_MAX:
+                    _FILE_CACHE.clear()
+                _FILE_CACHE[key] = partial
+
+            return partial
+
+        return await asyncio.gather(*(analyze_one(*entry) for entry in py_entries))
+
+    @staticmethod
+    def _analyze_one_file(full_path: str, is_test_file: bool) -> Optional[Dict[str, Any]]:
+        """Read and analyze one Python file into a mergeable partial result.
+
+        Static (no self) so it can run in a worker process; the partial it
+        returns holds only picklable builtins.
+        """
+        cls = CodeAnalysisService
         try:
-            structure = {
-                "directories": [],
-                "python_files": [],
-                "test_files": [],
-                "config_files": [],
-                "main_modules": []
-            }
-            
-            for root, dirs, files in os.walk(repo_path):
-                # Skip common ignored directories
-                dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['__pycache__', 'venv', 'node_modules']]
-                
-                rel_root = os.path.relpath(root, repo_path)
-                if rel_root != '.':
-                    structure["directories"].append(rel_root)
-                
-                for file in files:
-                    file_path = os.path.join(rel_root, file) if rel_root != '.' else file
-                    
-                    if file.endswith('.py'):
-                        structure["python_files"].append(file_path)
-                        if file.startswith('test_') or 'test' in file_path:
-                            structure["test_files"].append(file_path)
-                        elif file in ['main.py', 'app.py', '__init__.py']:
-                            structure["main_modules"].append(file_path)
-                    
-                    elif file in ['requirements.txt', 'pyproject.toml', 'setup.py', '.env', 'docker-compose.yml']:
-                        structure["config_files"].append(file_path)
-            
-            return structure
-            
-        except Exception as e:
-            logger.error(f"Error analyzing structure: {str(e)}")
-            return {}
-    
-    async def _analyze_code_patterns(self, repo_path: str) -> Dict[str, Any]:
-        """Analyze coding patterns and conventions."""
+            large = os.stat(full_path).st_size >= _MMAP_THRESHOLD
+        except OSError as e:
+            logger.debug(f"Could not stat {full_path}: {str(e)}")
+            return None
+
+        if large:
+            return cls._analyze_large_file(full_path, parse=not is_test_file)
+
+        content, tree = cls._read_and_parse(full_path, not is_test_file)
+        if content is None:
+            return None
+
+        partial: Dict[str, Any] = {
+            "patterns": None,
+            "markers": frozenset(m.lastgroup for m in _MARKER_RE.finditer(content)),
+            "api_patterns": None,
+        }
+
+        if tree is not None:
+            patterns = cls._empty_patterns()
+            cls._extract_patterns_from_ast(tree, patterns)
+            partial["patterns"] = patterns
+
+        if 'fastapi' in partial["markers"]:
+            api_patterns = cls._empty_api_patterns()
+            cls._scan_fastapi_patterns(content, api_patterns)
+            partial["api_patterns"] = api_patterns
+
+        return partial
+
+    @staticmethod
+    def _analyze_large_file(full_path: str, parse: bool) -> Optional[Dict[str, Any]]:
+        """
+        Analyze a large Python file through a read-only memory map.
+
+        The bytes marker regex scans the kernel page cache with no copy;
+        the file content is only materialized (and decoded) when an AST
+        parse or a FastAPI line scan actually needs it, which skips the
+        UTF-8 decode entirely for large test files.
+        """
+        cls = CodeAnalysisService
         try:
-            patterns = {
-                "naming_conventions": {
-                    "functions": [],
-                    "classes": [],
-                    "variables": []
-                },
-                "import_patterns": [],
-                "docstring_style": "unknown",
-                "type_hints_usage": False,
-                "async_patterns": False,
-                "error_handling": []
-            }
-            
-            # Analyze Python files
-            for root, dirs, files in os.walk(repo_path):
-                dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['__pycache__', 'venv']]
-                
-                for file in files:
-                    if file.endswith('.py') and not file.startswith('test_'):
-                        file_path = os.path.join(root, file)
-                        try:
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                                tree = ast.parse(content)
-                                self._extract_patterns_from_ast(tree, patterns)
-                        except Exception as e:
-                            logger.debug(f"Could not parse {file_path}: {str(e)}")
-                            continue
-            
-            # Deduplicate and summarize patterns
-            patterns["naming_conventions"]["functions"] = list(set(patterns["naming_conventions"]["functions"]))[:10]
-            patterns["naming_conventions"]["classes"] = list(set(patterns["naming_conventions"]["classes"]))[:10]
-            patterns["import_patterns"] = list(set(patterns["import_patterns"]))[:20]
-            
-            return patterns
-            
+            with open(full_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    markers = frozenset(m.lastgroup for m in _MARKER_RE_B.finditer(mm))
+                    data = mm[:] if parse or 'fastapi' in markers else None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not mmap {full_path}: {str(e)}")
+            return None
+
+        partial: Dict[str, Any] = {
+            "patterns": None,
+            "markers": markers,
+            "api_patterns": None,
+        }
+
+        if parse:
+            try:
+                # compile() accepts bytes and honors PEP 263 coding lines
+                tree = compile(data, full_path, 'exec',
+                               flags=_AST_FLAGS, dont_inherit=True, optimize=1)
+            except Exception as e:
+                logger.debug(f"Could not parse {full_path}: {str(e)}")
+                tree = None
+            if tree is not None:
+                patterns = cls._empty_patterns()
+                cls._extract_patterns_from_ast(tree, patterns)
+                partial["patterns"] = patterns
+
+        if 'fastapi' in markers:
+            api_patterns = cls._empty_api_patterns()
+            cls._scan_fastapi_patterns(data.decode('utf-8', 'replace'), api_patterns)
+            partial["api_patterns"] = api_patterns
+
+        return partial
+
+    def _merge_partial(
+        self,
+        partial: Dict[str, Any],
+        patterns: Dict[str, Any],
+        api_patterns: Dict[str, Any],
+    ):
+        """Merge one file's partial result into the aggregate buckets."""
+        file_patterns = partial["patterns"]
+        if file_patterns is not None:
+            naming = patterns["naming_conventions"]
+            file_naming = file_patterns["naming_conventions"]
+            if len(naming["functions"]) < 64:
+                naming["functions"].update(file_naming["functions"])
+            if len(naming["classes"]) < 64:
+                naming["classes"].update(file_naming["classes"])
+            if len(patterns["import_patterns"]) < 64:
+                patterns["import_patterns"].update(file_patterns["import_patterns"])
+            patterns["error_handling"].update(file_patterns["error_handling"])
+            if file_patterns["type_hints_usage"]:
+                patterns["type_hints_usage"] = True
+            if file_patterns["async_patterns"]:
+                patterns["async_patterns"] = True
+            if file_patterns["docstring_style"] != "unknown":
+                patterns["docstring_style"] = file_patterns["docstring_style"]
+
+        file_api = partial["api_patterns"]
+        if file_api is not None:
+            api_patterns["endpoint_patterns"].extend(file_api["endpoint_patterns"])
+            api_patterns["response_models"].extend(file_api["response_models"])
+            api_patterns["status_codes"].extend(file_api["status_codes"])
+
+    @staticmethod
+    def _read_and_parse(full_path: str, parse: bool) -> Tuple[Optional[str], Optional[ast.AST]]:
+        """Read a Python file and optionally parse it into an AST."""
+        try:
+            with open(full_path, 'r', encoding='utf-8') as f:
+                content = f.read()
         except Exception as e:
-            logger.error(f"Error analyzing code patterns: {str(e)}")
-            return {}
-    
-    def _extract_patterns_from_ast(self, tree: ast.AST, patterns: Dict[str, Any]):
+            logger.debug(f"Could not read {full_path}: {str(e)}")
+            return None, None
+
+        tree = None
+        if parse:
+            try:
+                # optimize=1 drops assert/__debug__ blocks before the walk;
+                # optimize=2 would also strip the docstrings we detect.
+                tree = compile(content, full_path, 'exec',
+                               flags=_AST_FLAGS, dont_inherit=True, optimize=1)
+            except Exception as e:
+                logger.debug(f"Could not parse {full_path}: {str(e)}")
+
+        return content, tree
+
+    @staticmethod
+    def _is_test_path(file: str, file_path: str) -> bool:
+        """
+        Whether a Python file is a test by name or by path segment.
+
+        Matching whole segments avoids the substring false positives of
+        'test' in file_path, which also flagged files like latest.py or
+        anything under a contest/ directory.
+        """
+        if file.startswith('test_'):
+            return True
+        return any(
+            part in ('test', 'tests') or part.startswith('test_')
+            for part in Path(file_path).parts
+        )
+
+    def _collect_structure(self, file: str, file_path: str, structure: Dict[str, Any],
+                           is_test_file: bool = False):
+        """Bucket a single file into the project structure summary."""
+        if file.endswith('.py'):
+            structure["python_files"].append(file_path)
+            if is_test_file:
+                structure["test_files"].append(file_path)
+            elif file in _MAIN_MODULES:
+                structure["main_modules"].append(file_path)
+
+        elif file in _CONFIG_FILES:
+            structure["config_files"].append(file_path)
+
+    @staticmethod
+    def _extract_patterns_from_ast(tree: ast.AST, patterns: Dict[str, Any]):
         """Extract patterns from an AST."""
-        for node in ast.walk(tree):
-            # Function names
-            if isinstance(node, ast.FunctionDef):
-                patterns["naming_conventions"]["functions"].append(node.name)
-                
-                # Check for async patterns
-                if isinstance(node, ast.AsyncFunctionDef):
-                    patterns["async_patterns"] = True
-                
-                # Check for type hints
-                if node.returns or any(arg.annotation for arg in node.args.args):
-                    patterns["type_hints_usage"] = True
-                
-                # Check for docstrings
-                if (node.body and isinstance(node.body[0], ast.Expr) and 
-                    isinstance(node.body[0].value, ast.Str)):
-                    if '"""' in node.body[0].value.s:
-                        patterns["docstring_style"] = "triple_quotes"
-            
-            # Class names
-            elif isinstance(node, ast.ClassDef):
-                patterns["naming_conventions"]["classes"].append(node.name)
-            
-            # Import patterns
-            elif isinstance(node, ast.Import):
-                for alias in node.names:
-                    patterns["import_patterns"].append(f"import {alias.name}")
-            
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    patterns["import_patterns"].append(f"from {node.module}")
-            
-            # Error handling patterns
-            elif isinstance(node, ast.Try):
-                patterns["error_handling"].append("try_except_block")
-            elif isinstance(node, ast.Raise):
-                patterns["error_handling"].append("raise_exception")
-    
-    async def _analyze_dependencies(self, repo_path: str) -> Dict[str, Any]:
-        """Analyze project dependencies."""
+        _PatternVisitor(patterns).visit(tree)
+
+    def _analyze_dependencies(self, repo_path: str) -> Dict[str, Any]:
+        """Analyze project dependencies; unreadable files yield partial results."""
+        dependencies = {
+            "requirements": [],
+            "dev_requirements": [],
+            "fastapi_version": None,
+            "python_version": None
+        }
+
+        # Check requirements.txt; version pins are picked out in the
+        # same pass instead of re-scanning the parsed list afterwards.
+        req_file = os.path.join(repo_path, "requirements.txt")
         try:
-            dependencies = {
-                "requirements": [],
-                "dev_requirements": [],
-                "fastapi_version": None,
-                "python_version": None
-            }
-            
-            # Check requirements.txt
-            req_file = os.path.join(repo_path, "requirements.txt")
-            if os.path.exists(req_file):
-                with open(req_file, 'r') as f:
-                    dependencies["requirements"] = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-            
-            # Check requirements-dev.txt
-            dev_req_file = os.path.join(repo_path, "requirements-dev.txt")
-            if os.path.exists(dev_req_file):
-                with open(dev_req_file, 'r') as f:
-                    dependencies["dev_requirements"] = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-            
-            # Extract specific versions
-            for req in dependencies["requirements"]:
-                if req.startswith("fastapi"):
-                    dependencies["fastapi_version"] = req
-                elif req.startswith("python"):
-                    dependencies["python_version"] = req
-            
-            return dependencies
-            
-        except Exception as e:
-            logger.error(f"Error analyzing dependencies: {str(e)}")
-            return {}
-    
-    async def _analyze_api_patterns(self, repo_path: str) -> Dict[str, Any]:
-        """Analyze FastAPI patterns and conventions."""
+            with open(req_file, 'r') as f:
+                requirements = dependencies["requirements"]
+                for line in f:
+                    line = line.strip()
+                    if not line or line[0] == '#':
+                        continue
+                    requirements.append(line)
+                    if line.startswith("fastapi"):
+                        dependencies["fastapi_version"] = line
+                    elif line.startswith("python"):
+                        dependencies["python_version"] = line
+        except OSError as e:
+            logger.debug(f"Could not read {req_file}: {str(e)}")
+
+        # Check requirements-dev.txt
+        dev_req_file = os.path.join(repo_path, "requirements-dev.txt")
         try:
-            api_patterns = {
-                "endpoint_patterns": [],
-                "response_models": [],
-                "request_models": [],
-                "status_codes": [],
-                "middleware_usage": False,
-                "dependency_injection": False
-            }
-            
-            # Look for FastAPI files
-            for root, dirs, files in os.walk(repo_path):
-                dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['__pycache__', 'venv']]
-                
-                for file in files:
-                    if file.endswith('.py'):
-                        file_path = os.path.join(root, file)
-                        try:
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                                
-                                # Check for FastAPI patterns
-                                if 'from fastapi' in content or 'import fastapi' in content:
-                                    api_patterns.update(self._extract_fastapi_patterns(content))
-                        
-                        except Exception as e:
-                            logger.debug(f"Could not analyze {file_path}: {str(e)}")
-                            continue
-            
-            return api_patterns
-            
-        except Exception as e:
-            logger.error(f"Error analyzing API patterns: {str(e)}")
-            return {}
-    
-    def _extract_fastapi_patterns(self, content: str) -> Dict[str, Any]:
+            with open(dev_req_file, 'r') as f:
+                dependencies["dev_requirements"] = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+        except OSError as e:
+            logger.debug(f"Could not read {dev_req_file}: {str(e)}")
+
+        return dependencies
+
+    @staticmethod
+    def _scan_fastapi_patterns(content: str, api_patterns: Dict[str, Any]):
         """Extract FastAPI-specific patterns from code content."""
-        patterns = {
-            "endpoint_patterns": [],
-            "response_models": [],
-            "status_codes": []
-        }
-        
         lines = content.split('\n')
-        
+
         for line in lines:
             stripped = line.strip()
-            
+
             # API endpoint patterns
             if stripped.startswith('@app.') or stripped.startswith('@router.'):
-                patterns["endpoint_patterns"].append(stripped)
-            
+                api_patterns["endpoint_patterns"].append(stripped)
+
             # Response models
             if 'response_model=' in stripped:
-                patterns["response_models"].append(stripped)
-            
+                api_patterns["response_models"].append(stripped)
+
             # Status codes
             if 'status_code=' in stripped:
-                patterns["status_codes"].append(stripped)
-        
-        return patterns
-    
-    async def _analyze_test_patterns(self, repo_path: str) -> Dict[str, Any]:
-        """Analyze testing patterns and conventions."""
-        try:
-            test_patterns = {
-                "test_framework": "unknown",
-                "test_structure": [],
-                "fixture_usage": False,
-                "mock_usage": False,
-                "async_tests": False
-            }
-            
-            # Look for test files
-            test_files = []
-            for root, dirs, files in os.walk(repo_path):
-                for file in files:
-                    if file.startswith('test_') or 'test' in os.path.basename(root):
-                        test_files.append(os.path.join(root, file))
-            
-            # Analyze test files
-            for test_file in test_files:
-                try:
-                    with open(test_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        
-                        # Detect test framework
-                        if 'import pytest' in content:
-                            test_patterns["test_framework"] = "pytest"
-                        elif 'import unittest' in content:
-                            test_patterns["test_framework"] = "unittest"
-                        
-                        # Check for fixtures
-                        if '@pytest.fixture' in content:
-                            test_patterns["fixture_usage"] = True
-                        
-                        # Check for mocking
-                        if 'mock' in content.lower() or 'Mock' in content:
-                            test_patterns["mock_usage"] = True
-                        
-                        # Check for async tests
-                        if 'async def test_' in content:
-                            test_patterns["async_tests"] = True
-                
-                except Exception as e:
-                    logger.debug(f"Could not analyze test file {test_file}: {str(e)}")
-                    continue
-            
-            return test_patterns
-            
-        except Exception as e:
-            logger.error(f"Error analyzing test patterns: {str(e)}")
-            return {}
-    
-    async def _analyze_configuration(self, repo_path: str) -> Dict[str, Any]:
-        """Analyze configuration patterns."""
+                api_patterns["status_codes"].append(stripped)
+
+    def _scan_test_patterns(self, markers: Set[str], test_patterns: Dict[str, Any]):
+        """Detect testing framework and conventions from a file's markers."""
+        # Detect test framework
+        if 'pytest' in markers:
+            test_patterns["test_framework"] = "pytest"
+        elif 'unittest' in markers:
+            test_patterns["test_framework"] = "unittest"
+
+        # Check for fixtures
+        if 'fixture' in markers:
+            test_patterns["fixture_usage"] = True
+
+        # Check for mocking
+        if 'mock' in markers:
+            test_patterns["mock_usage"] = True
+
+        # Check for async tests
+        if 'async_test' in markers:
+            test_patterns["async_tests"] = True
+
+    def _scan_settings_pattern(self, markers: Set[str], configuration: Dict[str, Any]):
+        """Detect the configuration style from a file's markers."""
+        if 'base_settings' in markers:
+            configuration["settings_pattern"] = "pydantic"
+        elif 'os_environ' in markers and configuration["settings_pattern"] == "unknown":
+            configuration["settings_pattern"] = "os_environ"
+
+    def _collect_config_files(self, repo_path: str, configuration: Dict[str, Any]):
+        """Check for well-known configuration files at the repository root."""
+        # One directory read instead of one stat per candidate name
         try:
-            config = {
-                "config_files": [],
-                "environment_variables": [],
-                "settings_pattern": "unknown",
-                "docker_usage": False
-            }
-            
-            # Check for configuration files
-            config_files = [
-                '.env', '.env.example', 'config.py', 'settings.py',
-                'docker-compose.yml', 'Dockerfile', 'pyproject.toml'
-            ]
-            
-            for config_file in config_files:
-                file_path = os.path.join(repo_path, config_file)
-                if os.path.exists(file_path):
-                    config["config_files"].append(config_file)
-                    
-                    if config_file in ['docker-compose.yml', 'Dockerfile']:
-                        config["docker_usage"] = True
-            
-            # Check for Pydantic settings
-            for root, dirs, files in os.walk(repo_path):
-                for file in files:
-                    if file.endswith('.py'):
-                        file_path = os.path.join(root, file)
-                        try:
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                                if 'BaseSettings' in content:
-                                    config["settings_pattern"] = "pydantic"
-                                elif 'os.environ' in content:
-                                    config["settings_pattern"] = "os_environ"
-                        except Exception:
-                            continue
-            
-            return config
-            
-        except Exception as e:
-            logger.error(f"Error analyzing configuration: {str(e)}")
-            return {}
-    
+            with os.scandir(repo_path) as entries:
+                present = {e.name for e in entries if e.is_file(follow_symlinks=False)}
+        except OSError as e:
+            logger.debug(f"Could not scan {repo_path}: {str(e)}")
+            return
+
+        for config_file in _ROOT_CONFIG_FILES:
+            if config_file in present:
+                configuration["config_files"].append(config_file)
+
+                if config_file in _DOCKER_FILES:
+                    configuration["docker_usage"] = True
+
     def get_analysis_summary(self, analysis: Dict[str, Any]) -> str:
         """Generate a human-readable summary of the analysis."""
-        try:
-            summary_parts = []
-            
-            # Structure summary
-            structure = analysis.get("structure", {})
-            py_files = len(structure.get("python_files", []))
-            test_files = len(structure.get("test_files", []))
-            summary_parts.append(f"Repository contains {py_files} Python files with {test_files} test files")
-            
-            # Patterns summary
-            patterns = analysis.get("patterns", {})
-            if patterns.get("async_patterns"):
-                summary_parts.append("Uses async/await patterns")
-            if patterns.get("type_hints_usage"):
-                summary_parts.append("Uses type hints")
-            
-            # Dependencies summary
-            deps = analysis.get("dependencies", {})
-            if deps.get("fastapi_version"):
-                summary_parts.append(f"Uses {deps['fastapi_version']}")
-            
-            # API patterns summary
-            api = analysis.get("api_patterns", {})
-            endpoints = len(api.get("endpoint_patterns", []))
-            if endpoints > 0:
-                summary_parts.append(f"Has {endpoints} API endpoint patterns")
-            
-            # Test patterns summary
-            tests = analysis.get("test_patterns", {})
-            framework = tests.get("test_framework", "unknown")
-            if framework != "unknown":
-                summary_parts.append(f"Uses {framework} for testing")
-            
-            return ". ".join(summary_parts) + "."
-            
-        except Exception as e:
-            logger.error(f"Error generating analysis summary: {str(e)}")
-            return "Analysis summary unavailable"
\ No newline at end of file
+        summary_parts = []
+
+        # Structure summary: prefer the scalar counts recorded during
+        # analysis; fall back to the structure lists for older dicts.
+        counts = analysis.get("counts") or {}
+        structure = analysis.get("structure") or {}
+        py_files = counts.get("python_files", len(structure.get("python_files") or ()))
+        test_files = counts.get("test_files", len(structure.get("test_files") or ()))
+        summary_parts.append(f"Repository contains {py_files} Python files with {test_files} test files")
+
+        # Patterns summary
+        patterns = analysis.get("patterns", {})
+        if patterns.get("async_patterns"):
+            summary_parts.append("Uses async/await patterns")
+        if patterns.get("type_hints_usage"):
+            summary_parts.append("Uses type hints")
+
+        # Dependencies summary
+        deps = analysis.get("dependencies", {})
+        if deps.get("fastapi_version"):
+            summary_parts.append(f"Uses {deps['fastapi_version']}")
+
+        # API patterns summary
+        api = analysis.get("api_patterns") or {}
+        endpoints = counts.get("endpoint_patterns", len(api.get("endpoint_patterns") or ()))
+        if endpoints > 0:
+            summary_parts.append(f"Has {endpoints} API endpoint patterns")
+
+        # Test patterns summary
+        tests = analysis.get("test_patterns", {})
+        framework = tests.get("test_framework", "unknown")
+        if framework != "unknown":
+            summary_parts.append(f"Uses {framework} for testing")
+
+        return f"{'. '.join(summary_parts)}."
+
+
+def _analyze_file_worker(full_path: str, is_test_file: bool) -> Optional[Dict[str, Any]]:
+    """Process-pool entry point for per-file analysis."""
+    return CodeAnalysisService._analyze_one_file(full_path, is_test_file)
@@ -0,0 +1,43 @@
+"""
+Shared Docker client for the Coding AI Agent.
+
+Every DockerEnvironmentService instance used to build its own client,
+each with its own urllib3 connection pool and file descriptors. The
+client here is a lazy module-level singleton, so all services share one
+pool regardless of how many service instances exist.
+"""
+
+import logging
+from functools import lru_cache
+
+import docker
+
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def get_docker_client() -> docker.DockerClient:
+    """Return the process-wide Docker client, creating it on first use.
+
+    The enlarged connection pool lets concurrent daemon calls reuse
+    keep-alive sockets instead of blocking on urllib3's default
+    10-connection pool; the client is thread-safe and shared freely.
+
+    Raises:
+        docker.errors.DockerException: If the daemon is unreachable
+    """
+    client = docker.from_env(max_pool_size=32)
+    client.ping()
+    logger.info("Shared Docker client initialized")
+    return client
+
+
+def close_docker_client() -> None:
+    """Close the shared client (shutdown hook); safe if never created."""
+    if get_docker_client.cache_info().currsize:
+        try:
+            get_docker_client().close()
+        except Exception as e:
+            logger.warning(f"Error closing Docker client: {str(e)}")
+        get_docker_client.cache_clear()
@@ -9,12 +9,20 @@ This service handles Docker container lifecycle management for testing:
 """
 
 import asyncio
+import codecs
+import functools
 import logging
 import os
-import tempfile
+import mmap
+import shlex
+import shutil
 import tarfile
+import threading
+import time
 import io
-from typing import Dict, Any, Optional, List
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Union
 from datetime import datetime
 import docker
 from docker.models.containers import Container
@@ -22,10 +30,27 @@ from docker.errors import DockerException, APIError
 
 from ..models.testing import CommandResult, ContainerInfo
 from ..config.settings import get_settings
+from .docker_pool import get_docker_client
 
 
 logger = logging.getLogger(__name__)
 
+# Dedicated executor for blocking daemon calls. The default loop executor
+# is shared with every other to_thread user in the process, so docker
+# round-trips would queue behind unrelated work (and vice versa); a named
+# pool also keeps daemon connection usage bounded and easy to spot in
+# thread dumps.
+_DOCKER_EXECUTOR = ThreadPoolExecutor(max_workers=32, thread_name_prefix="docker")
+
+# Host files at least this large are fed into tar archives through a
+# read-only mmap so the kernel page cache backs the bytes instead of a
+# full userspace copy.
+_MMAP_COPY_THRESHOLD = 1 << 20
+
+# Local repository snapshot images are committed under; tags are the
+# environment ids the snapshots belong to.
+_SNAPSHOT_REPOSITORY = "coding-agent/snap"
+
 
 class DockerEnvironmentService:
     """
@@ -42,24 +67,174 @@ class DockerEnvironmentService:
         self.settings = get_settings()
         
         try:
-            # Initialize Docker client
-            self.docker_client = docker.from_env()
-            
-            # Test Docker connectivity
-            self.docker_client.ping()
+            # Attach to the process-wide Docker client (one shared
+            # connection pool across service instances); it pings the
+            # daemon on first creation.
+            self.docker_client = get_docker_client()
             logger.info("Docker service initialized successfully")
-            
+
         except DockerException as e:
             logger.error(f"Failed to initialize Docker client: {str(e)}")
             self.docker_client = None
         
-        # Track active containers
+        # Track active containers. The dict answers by-id lookups; the
+        # parallel list keeps the ContainerInfo objects contiguous in
+        # creation order so monitoring endpoints can iterate them without
+        # walking dict buckets, with an index map for O(1) swap-removal.
         self.active_containers: Dict[str, ContainerInfo] = {}
-    
+        self._container_list: List[ContainerInfo] = []
+        self._container_index: Dict[str, int] = {}
+
+        # Bounds concurrent daemon operations so load spikes cannot
+        # exhaust the connection pool or pile up file descriptors.
+        self._sem = asyncio.Semaphore(self.settings.docker_max_concurrency)
+
+        # Circuit breaker over daemon calls: after _BREAKER_THRESHOLD
+        # consecutive Docker failures the breaker opens and calls
+        # short-circuit for _BREAKER_COOLDOWN seconds, so a sick daemon
+        # is not hammered into cascading failures.
+        self._breaker_failures = 0
+        self._breaker_open_until = 0.0
+
+        # (timestamp, result) of the last daemon ping. Availability checks
+        # sit on health-endpoint hot paths, so the answer is cached for a
+        # short TTL instead of paying a daemon round-trip per call.
+        self._ping_cache: tuple = (0.0, self.docker_client is not None)
+
+        # Cached Container handles: containers.get() costs a daemon
+        # round-trip per call, so keep the objects from create_container
+        # and only fall back to an inspect on a cache miss.
+        self._containers: Dict[str, Container] = {}
+
+        # Warm pool of pre-provisioned containers (setup already run).
+        # Acquiring an environment becomes a queue pop instead of paying
+        # container start plus setup on the critical path. Only generic
+        # containers are poolable: a workspace mount is per-environment.
+        self._pool: "asyncio.Queue[Container]" = asyncio.Queue()
+        self._pool_target = max(0, self.settings.docker_pool_size) if self.docker_client else 0
+        self._pool_filler: Optional[asyncio.Task] = None
+
+        # Default (and pool) image: prebuilt with system packages baked in,
+        # so per-container setup needs no apt-get network round-trips.
+        self._pool_image = self.settings.test_base_image
+
+        # Shared pip wheel cache, mounted into every test container: the
+        # first environment pays the download, the rest install from disk.
+        self._pip_cache_dir = self.settings.pip_cache_host_dir or os.path.join(
+            self.settings.workspace_path, "pip-cache"
+        )
+        os.makedirs(self._pip_cache_dir, exist_ok=True)
+
+        # Optional offline wheelhouse: a directory of pre-downloaded
+        # wheels mounted read-only, so pip resolves from local disk
+        # instead of N environments racing each other to PyPI.
+        self._wheelhouse_dir = self.settings.wheelhouse_host_dir
+
+    def _shared_volumes(self) -> Dict[str, Dict[str, str]]:
+        """Volume mounts every test container gets: pip cache, wheelhouse."""
+        volumes = {self._pip_cache_dir: {"bind": "/root/.cache/pip", "mode": "rw"}}
+        if self._wheelhouse_dir:
+            volumes[self._wheelhouse_dir] = {"bind": "/wheelhouse", "mode": "ro"}
+        return volumes
+
+    def _ensure_pool_filled(self):
+        """Start the background refill task if the pool is below target."""
+        if self._pool_target <= 0 or self._pool.qsize() >= self._pool_target:
+            return
+        if self._pool_filler is None or self._pool_filler.done():
+            self._pool_filler = asyncio.get_event_loop().create_task(self._fill_pool())
+
+    async def _fill_pool(self):
+        """Provision generic containers until the pool reaches its target."""
+        while self._pool.qsize() < self._pool_target:
+            try:
+                container = await self._provision_pool_container()
+            except Exception as e:
+                logger.warning(f"Could not pre-warm container pool: {str(e)}")
+                break
+            self._pool.put_nowait(container)
+
+    async def _provision_pool_container(self) -> Container:
+        """Create and set up one generic pool container."""
+        name = f"coding-agent-pool-{uuid.uuid4().hex[:8]}"
+        container = await asyncio.get_event_loop().run_in_executor(
+            _DOCKER_EXECUTOR,
+            functools.partial(
+                self.docker_client.containers.run,
+                image=self._pool_image,
+                name=name,
+                command="tail -f /dev/null",
+                detach=True,
+                environment={"PYTHONPATH": "/app", "PYTHONUNBUFFERED": "1"},
+                volumes=self._shared_volumes(),
+                working_dir="/app",
+                network_mode=self.settings.docker_network_mode,
+                mem_limit="1g",
+                cpu_count=1,
+                remove=False
+            )
+        )
+        await self._setup_container_structure(container)
+        return container
+
+    _BREAKER_THRESHOLD = 5   # consecutive failures before the breaker opens
+    _BREAKER_COOLDOWN = 10.0  # seconds the breaker stays open
+
+    def _check_breaker(self):
+        """Raise without touching the daemon while the breaker is open."""
+        if self._breaker_open_until > time.monotonic():
+            raise DockerException(
+                f"Docker circuit breaker open after {self._breaker_failures} "
+                f"consecutive failures"
+            )
+
+    def _breaker_success(self):
+        """Record a successful daemon call, closing the breaker."""
+        self._breaker_failures = 0
+
+    def _breaker_failure(self):
+        """Record a failed daemon call, opening the breaker at threshold."""
+        self._breaker_failures += 1
+        if self._breaker_failures >= self._BREAKER_THRESHOLD:
+            self._breaker_open_until = time.monotonic() + self._BREAKER_COOLDOWN
+            logger.warning(
+                f"Docker circuit breaker opened for {self._BREAKER_COOLDOWN}s "
+                f"after {self._breaker_failures} consecutive failures"
+            )
+
+    def _track_container(self, info: ContainerInfo):
+        """Record a container in the dict, list and index together."""
+        self.active_containers[info.container_id] = info
+        self._container_index[info.container_id] = len(self._container_list)
+        self._container_list.append(info)
+
+    def _untrack_container(self, container_id: str):
+        """Drop a container from all tracking structures in O(1).
+
+        Swap-remove: the last list entry moves into the freed slot, so
+        creation order is preserved for all entries before it.
+        """
+        self.active_containers.pop(container_id, None)
+        index = self._container_index.pop(container_id, None)
+        if index is None:
+            return
+        last = self._container_list.pop()
+        if index < len(self._container_list):
+            self._container_list[index] = last
+            self._container_index[last.container_id] = index
+
+    def _get_container(self, container_id: str) -> Container:
+        """Return the cached container handle, inspecting only on miss."""
+        container = self._containers.get(container_id)
+        if container is None:
+            container = self.docker_client.containers.get(container_id)
+            self._containers[container_id] = container
+        return container
+
     async def create_container(
         self, 
         env_id: str,
-        image: str = "python:3.9-slim",
+        image: Optional[str] = None,
         workspace_path: str = None
     ) -> Optional[Container]:
         """
@@ -67,7 +242,7 @@ class DockerEnvironmentService:
         
         Args:
             env_id: Environment identifier
-            image: Docker image to use
+            image: Docker image to use (defaults to the prebuilt test base image)
             workspace_path: Host workspace path to mount
             
         Returns:
@@ -76,95 +251,260 @@ class DockerEnvironmentService:
         try:
             if not self.docker_client:
                 raise Exception("Docker client not available")
+
+            if image is None:
+                image = self._pool_image
             
-            logger.info(f"Creating Docker container for environment {env_id}")
-            
-            # Container configuration
-            container_name = f"coding-agent-test-{env_id}"
-            
-            # Prepare environment variables
-            env_vars = {
-                "PYTHONPATH": "/app",
-                "PYTHONUNBUFFERED": "1",
-                "ENV_ID": env_id
-            }
-            
-            # Prepare volumes if workspace provided
-            volumes = {}
-            if workspace_path and os.path.exists(workspace_path):
-                volumes[workspace_path] = {"bind": "/workspace", "mode": "rw"}
-            
-            # Create container
-            container = self.docker_client.containers.run(
-                image=image,
-                name=container_name,
-                command="tail -f /dev/null",  # Keep container running
-                detach=True,
-                environment=env_vars,
-                volumes=volumes,
-                working_dir="/app",
-                network_mode=self.settings.docker_network_mode,
-                mem_limit="1g",  # Memory limit
-                cpu_count=1,     # CPU limit
-                remove=False,    # Don't auto-remove for debugging
-                tty=True,
-                stdin_open=True
-            )
-            
-            # Create container info object
-            container_info = ContainerInfo(
-                container_id=container.id,
-                env_id=env_id,
-                name=container_name,
-                image=image,
-                status="running",
-                created_at=datetime.utcnow(),
-                workspace_path=workspace_path
-            )
+            async with self._sem:
+                logger.info(f"Creating Docker container for environment {env_id}")
             
-            # Store in active containers
-            self.active_containers[container.id] = container_info
+                # Container configuration
+                container_name = f"coding-agent-test-{env_id}"
             
-            # Set up basic directory structure in container
-            await self._setup_container_structure(container)
+                # Prepare environment variables
+                env_vars = {
+                    "PYTHONPATH": "/app",
+                    "PYTHONUNBUFFERED": "1",
+                    "ENV_ID": env_id
+                }
             
-            logger.info(f"Container {container_name} created successfully")
-            return container
+                # Prepare volumes if workspace provided
+                volumes = {}
+                if workspace_path and os.path.exists(workspace_path):
+                    volumes[workspace_path] = {"bind": "/workspace", "mode": "rw"}
+
+                # Take a pre-warmed container when one fits: generic image and
+                # no per-environment volume mount. Acquisition is then a queue
+                # pop instead of container start plus setup.
+                container = None
+                pool_eligible = image == self._pool_image and not volumes
+                if pool_eligible:
+                    try:
+                        container = self._pool.get_nowait()
+                        container_name = container.name
+                        logger.info(f"Acquired pre-warmed container for environment {env_id}")
+                    except asyncio.QueueEmpty:
+                        container = None
+
+                setup_needed = container is None
+                if setup_needed:
+                    # Every container shares the host pip cache (and
+                    # wheelhouse, if configured); pooled containers get
+                    # the same mounts at provisioning time
+                    volumes.update(self._shared_volumes())
+
+                    # Create container; containers.run blocks on image
+                    # resolution plus the create/start round-trips, so it
+                    # runs on the docker pool rather than the event loop
+                    container = await asyncio.get_event_loop().run_in_executor(
+                        _DOCKER_EXECUTOR,
+                        functools.partial(
+                            self.docker_client.containers.run,
+                            image=image,
+                            name=container_name,
+                            command="tail -f /dev/null",  # Keep container running
+                            detach=True,
+                            environment=env_vars,
+                            volumes=volumes,
+                            working_dir="/app",
+                            network_mode=self.settings.docker_network_mode,
+                            mem_limit="1g",  # Memory limit
+                            cpu_count=1,     # CPU limit
+                            remove=False     # Don't auto-remove for debugging
+                        )
+                    )
+
+                # Create container info object
+                container_info = ContainerInfo(
+                    container_id=container.id,
+                    env_id=env_id,
+                    name=container_name,
+                    image=image,
+                    status="running",
+                    created_at=datetime.utcnow(),
+                    workspace_path=workspace_path
+                )
+
+                # Store in active containers and cache the handle
+                self._track_container(container_info)
+                self._containers[container.id] = container
+
+                # Set up basic directory structure in container (already done
+                # for pooled containers)
+                if setup_needed:
+                    await self._setup_container_structure(container)
+
+                # Kick off a background refill to replace what was taken
+                if pool_eligible:
+                    self._ensure_pool_filled()
+
+                logger.info(f"Container {container_name} created successfully")
+                return container
             
         except Exception as e:
             logger.error(f"Failed to create container for {env_id}: {str(e)}")
             return None
     
     async def _setup_container_structure(self, container: Container):
-        """Set up basic directory structure in the container."""
+        """Set up basic directory structure in the container.
+
+        Only the cheap, environment-specific mkdir batch runs here; system
+        packages are baked into the test base image (see
+        docker/Dockerfile.test-base) instead of apt-get installed per
+        container, which dominated provisioning time.
+        """
         try:
-            # Create necessary directories
-            directories = ["/app", "/app/tests", "/app/src", "/tmp"]
-            
-            for directory in directories:
-                result = container.exec_run(f"mkdir -p {directory}")
-                if result.exit_code != 0:
-                    logger.warning(f"Failed to create directory {directory}: {result.output.decode()}")
-            
-            # Install basic system dependencies
-            system_packages = [
-                "apt-get update",
-                "apt-get install -y curl wget git build-essential",
-                "apt-get clean"
-            ]
-            
-            for cmd in system_packages:
-                result = container.exec_run(f"sh -c '{cmd}'")
-                if result.exit_code != 0:
-                    logger.warning(f"Failed to execute: {cmd}")
-            
+            # argv form: runc execs mkdir directly, no /bin/sh fork
+            result = await asyncio.get_event_loop().run_in_executor(
+                _DOCKER_EXECUTOR,
+                container.exec_run,
+                ["mkdir", "-p", "/app", "/app/tests", "/app/src", "/tmp"]
+            )
+            if result.exit_code != 0:
+                output = result.output.decode() if result.output else ""
+                logger.warning(f"Container setup failed: {output[-500:]}")
+
         except Exception as e:
             logger.error(f"Error setting up container structure: {str(e)}")
     
+    async def snapshot_container(self, container_id: str, tag: str) -> Optional[str]:
+        """
+        Commit a running container's filesystem to a local snapshot image.
+
+        pause=False keeps the container (and any service it runs)
+        live while the layers are committed; forks of the snapshot then
+        start from the fully prepared state instead of re-running
+        dependency installation and service startup.
+
+        Args:
+            container_id: Container to snapshot
+            tag: Image tag, conventionally the environment id
+
+        Returns:
+            Full image tag of the snapshot, or None on failure
+        """
+        try:
+            if not self.docker_client:
+                raise Exception("Docker client not available")
+
+            async with self._sem:
+                self._check_breaker()
+                # The high-level Container.commit always pauses; go through
+                # the low-level API to commit without stopping the world.
+                api = self.docker_client.api
+                await asyncio.get_event_loop().run_in_executor(
+                    _DOCKER_EXECUTOR,
+                    functools.partial(
+                        api.commit,
+                        container_id,
+                        repository=_SNAPSHOT_REPOSITORY,
+                        tag=tag,
+                        pause=False
+                    )
+                )
+                self._breaker_success()
+
+            image_tag = f"{_SNAPSHOT_REPOSITORY}:{tag}"
+            logger.info(f"Snapshot {image_tag} taken from container {container_id}")
+            return image_tag
+
+        except Exception as e:
+            logger.error(f"Failed to snapshot container {container_id}: {str(e)}")
+            if isinstance(e, DockerException):
+                self._breaker_failure()
+            return None
+
+    async def fork_container(self, image_tag: str, env_id: str) -> Optional[Container]:
+        """
+        Start a disposable sibling container from a snapshot image.
+
+        The fork begins life with the snapshot's filesystem — deps
+        installed, sources in place — so startup cost is container
+        creation alone rather than the full environment setup.
+
+        Args:
+            image_tag: Snapshot image to fork (from snapshot_container)
+            env_id: Environment identifier for the fork
+
+        Returns:
+            Created container object or None if failed
+        """
+        try:
+            if not self.docker_client:
+                raise Exception("Docker client not available")
+
+            async with self._sem:
+                container_name = f"coding-agent-fork-{env_id}"
+                container = await asyncio.get_event_loop().run_in_executor(
+                    _DOCKER_EXECUTOR,
+                    functools.partial(
+                        self.docker_client.containers.run,
+                        image=image_tag,
+                        name=container_name,
+                        command="tail -f /dev/null",
+                        detach=True,
+                        environment={
+                            "PYTHONPATH": "/app",
+                            "PYTHONUNBUFFERED": "1",
+                            "ENV_ID": env_id
+                        },
+                        volumes=self._shared_volumes(),
+                        working_dir="/app",
+                        network_mode=self.settings.docker_network_mode,
+                        mem_limit="1g",
+                        cpu_count=1,
+                        remove=False
+                    )
+                )
+
+                container_info = ContainerInfo(
+                    container_id=container.id,
+                    env_id=env_id,
+                    name=container_name,
+                    image=image_tag,
+                    status="running",
+                    created_at=datetime.utcnow()
+                )
+                self._track_container(container_info)
+                self._containers[container.id] = container
+
+                logger.info(f"Forked container {container_name} from {image_tag}")
+                return container
+
+        except Exception as e:
+            logger.error(f"Failed to fork container from {image_tag}: {str(e)}")
+            return None
+
+    async def remove_image(self, image_tag: str) -> bool:
+        """
+        Remove a local image (snapshot cleanup).
+
+        Args:
+            image_tag: Image tag to remove
+
+        Returns:
+            True if removal successful, False otherwise
+        """
+        try:
+            if not self.docker_client:
+                raise Exception("Docker client not available")
+
+            async with self._sem:
+                await asyncio.get_event_loop().run_in_executor(
+                    _DOCKER_EXECUTOR,
+                    functools.partial(self.docker_client.images.remove, image_tag, force=True)
+                )
+            logger.debug(f"Image {image_tag} removed")
+            return True
+
+        except Exception as e:
+            logger.warning(f"Error removing image {image_tag}: {str(e)}")
+            return False
+
     async def execute_command(
-        self, 
-        container_id: str, 
-        command: str,
+        self,
+        container_id: str,
+        command: Union[str, List[str]],
         timeout: int = 60,
         working_dir: str = "/app"
     ) -> CommandResult:
@@ -173,65 +513,141 @@ class DockerEnvironmentService:
         
         Args:
             container_id: Container ID
-            command: Command to execute
+            command: Command to execute; argv lists run without a shell
+                fork and are safe against quoting issues
             timeout: Command timeout in seconds
             working_dir: Working directory for command execution
             
         Returns:
             Command execution result
         """
+        command_str = command if isinstance(command, str) else shlex.join(command)
         try:
             if not self.docker_client:
                 raise Exception("Docker client not available")
             
-            container = self.docker_client.containers.get(container_id)
-            
-            logger.debug(f"Executing command in {container_id}: {command}")
-            
-            # Execute command with timeout
-            result = await asyncio.wait_for(
-                asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: container.exec_run(
+            async with self._sem:
+                self._check_breaker()
+                logger.debug(f"Executing command in {container_id}: {command_str}")
+
+                # Drive the exec through the low-level API on one keep-alive
+                # connection; demux=True keeps stdout and stderr separate,
+                # which the high-level exec_run wrapper merges away.
+                api = self.docker_client.api
+                start = time.monotonic()
+
+                def _exec():
+                    exec_id = api.exec_create(
+                        container_id,
                         command,
+                        stdout=True,
+                        stderr=True,
                         workdir=working_dir,
                         environment={"PYTHONPATH": "/app"}
-                    )
-                ),
-                timeout=timeout
-            )
-            
-            # Decode output
-            stdout = result.output.decode('utf-8') if result.output else ""
-            stderr = ""  # Docker exec_run combines stdout and stderr
-            
-            return CommandResult(
-                exit_code=result.exit_code,
-                stdout=stdout,
-                stderr=stderr,
-                command=command,
-                duration_seconds=0  # TODO: Add timing
-            )
+                    )['Id']
+                    out, err = api.exec_start(exec_id, demux=True)
+                    exit_code = api.exec_inspect(exec_id)['ExitCode']
+                    return exit_code, out, err
+
+                exit_code, out, err = await asyncio.wait_for(
+                    asyncio.get_event_loop().run_in_executor(_DOCKER_EXECUTOR, _exec),
+                    timeout=timeout
+                )
+
+                self._breaker_success()
+                return CommandResult(
+                    exit_code=exit_code,
+                    stdout=out.decode('utf-8') if out else "",
+                    stderr=err.decode('utf-8') if err else "",
+                    command=command_str,
+                    duration_seconds=time.monotonic() - start
+                )
             
         except asyncio.TimeoutError:
-            logger.error(f"Command timeout after {timeout}s: {command}")
+            logger.error(f"Command timeout after {timeout}s: {command_str}")
             return CommandResult(
                 exit_code=124,  # Timeout exit code
                 stdout="",
                 stderr=f"Command timed out after {timeout} seconds",
-                command=command,
+                command=command_str,
                 duration_seconds=timeout
             )
         except Exception as e:
             logger.error(f"Error executing command: {str(e)}")
+            if isinstance(e, DockerException):
+                self._ping_cache = (0.0, False)
+                self._breaker_failure()
             return CommandResult(
                 exit_code=1,
                 stdout="",
                 stderr=str(e),
-                command=command,
+                command=command_str,
                 duration_seconds=0
             )
     
+    async def execute_command_stream(
+        self,
+        container_id: str,
+        command: Union[str, List[str]],
+        working_dir: str = "/app"
+    ):
+        """
+        Execute a command and yield its output incrementally.
+
+        Yields raw output chunks (bytes) as the command produces them,
+        so callers can bound their own memory instead of buffering the
+        whole stdout; the final item is a CommandResult carrying the
+        exit code and duration (stdout/stderr left empty — the chunks
+        already streamed past).
+
+        Args:
+            container_id: Container ID
+            command: Command to execute; argv lists run without a shell fork
+            working_dir: Working directory for command execution
+        """
+        command_str = command if isinstance(command, str) else shlex.join(command)
+        if not self.docker_client:
+            raise Exception("Docker client not available")
+
+        async with self._sem:
+            self._check_breaker()
+            api = self.docker_client.api
+            loop = asyncio.get_event_loop()
+            start = time.monotonic()
+
+            def _start():
+                exec_id = api.exec_create(
+                    container_id,
+                    command,
+                    stdout=True,
+                    stderr=True,
+                    workdir=working_dir,
+                    environment={"PYTHONPATH": "/app"}
+                )['Id']
+                return exec_id, api.exec_start(exec_id, stream=True, demux=True)
+
+            exec_id, stream = await loop.run_in_executor(_DOCKER_EXECUTOR, _start)
+
+            while True:
+                item = await loop.run_in_executor(_DOCKER_EXECUTOR, next, stream, None)
+                if item is None:
+                    break
+                out, err = item
+                if out:
+                    yield out
+                if err:
+                    yield err
+
+            exit_code = await loop.run_in_executor(
+                _DOCKER_EXECUTOR, lambda: api.exec_inspect(exec_id)['ExitCode']
+            )
+            self._breaker_success()
+            yield CommandResult(
+                exit_code=exit_code if exit_code is not None else 1,
+                command=command_str,
+                duration_seconds=time.monotonic() - start
+            )
+
     async def execute_command_background(
         self, 
         container_id: str, 
@@ -251,23 +667,27 @@ class DockerEnvironmentService:
             if not self.docker_client:
                 raise Exception("Docker client not available")
             
-            container = self.docker_client.containers.get(container_id)
-            
-            logger.debug(f"Executing background command in {container_id}: {command}")
+            async with self._sem:
+                container = self._get_container(container_id)
             
-            # Execute in background using nohup
-            bg_command = f"nohup {command} > /tmp/bg_output.log 2>&1 &"
+                logger.debug(f"Executing background command in {container_id}: {command}")
             
-            result = container.exec_run(bg_command, detach=True)
+                # Execute in background using nohup
+                bg_command = f"nohup {command} > /tmp/bg_output.log 2>&1 &"
+
+                result = await asyncio.get_event_loop().run_in_executor(
+                    _DOCKER_EXECUTOR,
+                    functools.partial(container.exec_run, bg_command, detach=True)
+                )
             
-            return CommandResult(
-                exit_code=0,  # Background command started
-                stdout="Background command started",
-                stderr="",
-                command=command,
-                duration_seconds=0,
-                success=True
-            )
+                return CommandResult(
+                    exit_code=0,  # Background command started
+                    stdout="Background command started",
+                    stderr="",
+                    command=command,
+                    duration_seconds=0,
+                    success=True
+                )
             
         except Exception as e:
             logger.error(f"Error executing background command: {str(e)}")
@@ -302,30 +722,52 @@ class DockerEnvironmentService:
             if not self.docker_client:
                 raise Exception("Docker client not available")
             
-            container = self.docker_client.containers.get(container_id)
-            
-            if not os.path.exists(host_path):
-                raise FileNotFoundError(f"Host file not found: {host_path}")
-            
-            # Create a tar archive with the file
-            tar_buffer = io.BytesIO()
-            with tarfile.open(fileobj=tar_buffer, mode='w') as tar:
-                tar.add(host_path, arcname=os.path.basename(container_path))
-            tar_buffer.seek(0)
-            
-            # Copy to container
-            container.put_archive(
-                path=os.path.dirname(container_path),
-                data=tar_buffer.getvalue()
-            )
+            async with self._sem:
+                container = self._get_container(container_id)
+
+                # Tar construction and put_archive both block (disk reads,
+                # HTTP to the daemon), so the whole copy runs off-loop
+                await asyncio.get_event_loop().run_in_executor(
+                    _DOCKER_EXECUTOR,
+                    self._copy_file_sync, container, host_path, container_path
+                )
             
-            logger.debug(f"File copied: {host_path} -> {container_path}")
-            return True
+                logger.debug(f"File copied: {host_path} -> {container_path}")
+                return True
             
         except Exception as e:
             logger.error(f"Error copying file to container: {str(e)}")
             return False
-    
+
+    @classmethod
+    def _copy_file_sync(cls, container: Container, host_path: str, container_path: str):
+        """Blocking body of copy_file_to_container; runs on the docker pool."""
+        if not os.path.exists(host_path):
+            raise FileNotFoundError(f"Host file not found: {host_path}")
+
+        # Create a tar archive with the file; large files are added
+        # through a read-only mmap so the page cache backs the bytes.
+        st = os.stat(host_path)
+        tar_buffer = io.BytesIO()
+        with tarfile.open(fileobj=tar_buffer, mode='w') as tar:
+            if st.st_size >= _MMAP_COPY_THRESHOLD:
+                with open(host_path, 'rb') as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        info = tarfile.TarInfo(name=os.path.basename(container_path))
+                        info.size = st.st_size
+                        info.mtime = st.st_mtime
+                        info.mode = st.st_mode & 0o777
+                        tar.addfile(info, mm)
+            else:
+                tar.add(host_path, arcname=os.path.basename(container_path))
+
+        # Copy to container; getbuffer() hands put_archive a zero-copy
+        # view instead of duplicating the whole archive with getvalue()
+        container.put_archive(
+            path=os.path.dirname(container_path),
+            data=tar_buffer.getbuffer()
+        )
+
     async def copy_directory_to_container(
         self, 
         container_id: str, 
@@ -347,30 +789,112 @@ class DockerEnvironmentService:
             if not self.docker_client:
                 raise Exception("Docker client not available")
             
-            container = self.docker_client.containers.get(container_id)
-            
-            if not os.path.exists(host_dir):
-                raise FileNotFoundError(f"Host directory not found: {host_dir}")
-            
-            # Create tar archive of the directory
-            tar_buffer = io.BytesIO()
-            with tarfile.open(fileobj=tar_buffer, mode='w') as tar:
-                tar.add(host_dir, arcname=os.path.basename(container_dir))
-            tar_buffer.seek(0)
-            
-            # Copy to container
-            container.put_archive(
-                path=os.path.dirname(container_dir),
-                data=tar_buffer.getvalue()
-            )
+            async with self._sem:
+                container = self._get_container(container_id)
+
+                # The tar producer and put_archive consumer both block, so
+                # the pipe plumbing runs off-loop as one unit
+                await asyncio.get_event_loop().run_in_executor(
+                    _DOCKER_EXECUTOR,
+                    self._copy_directory_sync, container, host_dir, container_dir
+                )
             
-            logger.debug(f"Directory copied: {host_dir} -> {container_dir}")
-            return True
+                logger.debug(f"Directory copied: {host_dir} -> {container_dir}")
+                return True
             
         except Exception as e:
             logger.error(f"Error copying directory to container: {str(e)}")
             return False
-    
+
+    @classmethod
+    def _copy_directory_sync(cls, container: Container, host_dir: str, container_dir: str):
+        """Blocking body of copy_directory_to_container; runs on the docker pool."""
+        if not os.path.exists(host_dir):
+            raise FileNotFoundError(f"Host directory not found: {host_dir}")
+
+        # Stream the archive through a pipe instead of buffering it
+        # in memory: a writer thread produces the tar while
+        # put_archive consumes it, so memory stays O(pipe buffer)
+        # rather than O(archive size) for large workspaces.
+        read_fd, write_fd = os.pipe()
+        producer_error: List[BaseException] = []
+
+        def _produce():
+            try:
+                with os.fdopen(write_fd, 'wb') as write_end:
+                    # 'w|' writes sequentially, which is all a pipe allows
+                    with tarfile.open(fileobj=write_end, mode='w|') as tar:
+                        cls._tar_dir_fast(host_dir, os.path.basename(container_dir), tar)
+            except BaseException as e:
+                producer_error.append(e)
+
+        # A plain thread, not the shared docker pool: this sync body
+        # already occupies a pool worker, and pairing producer and
+        # consumer from one bounded pool could deadlock at saturation.
+        producer = threading.Thread(target=_produce, daemon=True)
+        producer.start()
+        try:
+            with os.fdopen(read_fd, 'rb') as read_end:
+                container.put_archive(
+                    path=os.path.dirname(container_dir),
+                    data=read_end
+                )
+        finally:
+            # Surface writer-side failures (a truncated archive also
+            # makes put_archive itself raise)
+            producer.join()
+            if producer_error:
+                raise producer_error[0]
+
+    @staticmethod
+    def _tar_dir_fast(host_dir: str, arcname_root: str, tar: tarfile.TarFile):
+        """Add a directory tree to an open tar archive, fast.
+
+        tar.add() re-stats and re-opens every entry with a small copy
+        buffer, which dominates large directory copies. This walk visits
+        each entry once via os.scandir, builds TarInfo straight from the
+        cached stat result, and streams regular-file bytes with a 1 MiB
+        buffer, padding and advancing the archive offset by hand.
+        """
+        root_st = os.stat(host_dir)
+        root_info = tarfile.TarInfo(name=arcname_root)
+        root_info.type = tarfile.DIRTYPE
+        root_info.mode = root_st.st_mode & 0o7777
+        root_info.mtime = root_st.st_mtime
+        tar.addfile(root_info)
+
+        stack = [(host_dir, arcname_root)]
+        while stack:
+            dir_path, dir_arcname = stack.pop()
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    st = entry.stat(follow_symlinks=False)
+                    info = tarfile.TarInfo(name=f"{dir_arcname}/{entry.name}")
+                    info.mode = st.st_mode & 0o7777
+                    info.mtime = st.st_mtime
+
+                    if entry.is_symlink():
+                        info.type = tarfile.SYMTYPE
+                        info.linkname = os.readlink(entry.path)
+                        tar.addfile(info)
+                    elif entry.is_dir(follow_symlinks=False):
+                        info.type = tarfile.DIRTYPE
+                        tar.addfile(info)
+                        stack.append((entry.path, info.name))
+                    elif entry.is_file(follow_symlinks=False):
+                        info.size = st.st_size
+                        tar.addfile(info)
+                        with open(entry.path, 'rb', buffering=0) as f:
+                            shutil.copyfileobj(f, tar.fileobj, length=1 << 20)
+                        # addfile() without a fileobj only writes the header;
+                        # pad the data to a whole block and fix up the offset
+                        # the same way tarfile does internally.
+                        blocks, remainder = divmod(st.st_size, tarfile.BLOCKSIZE)
+                        if remainder:
+                            tar.fileobj.write(b"\0" * (tarfile.BLOCKSIZE - remainder))
+                            blocks += 1
+                        tar.offset += blocks * tarfile.BLOCKSIZE
+
     async def write_file_in_container(
         self, 
         container_id: str, 
@@ -392,34 +916,137 @@ class DockerEnvironmentService:
             if not self.docker_client:
                 raise Exception("Docker client not available")
             
-            container = self.docker_client.containers.get(container_id)
-            
-            # Create directory if it doesn't exist
-            dir_path = os.path.dirname(file_path)
-            if dir_path:
-                result = container.exec_run(f"mkdir -p {dir_path}")
-                if result.exit_code != 0:
-                    logger.warning(f"Failed to create directory {dir_path}")
-            
-            # Create temporary file on host
-            with tempfile.NamedTemporaryFile(mode='w', delete=False) as temp_file:
-                temp_file.write(content)
-                temp_file_path = temp_file.name
-            
-            try:
-                # Copy file to container
-                success = await self.copy_file_to_container(
-                    container_id, temp_file_path, file_path
+            async with self._sem:
+                container = self._get_container(container_id)
+
+                # Push the content straight from memory; parent directories
+                # are encoded in the archive itself, so no mkdir exec needed.
+                # put_archive blocks on HTTP, so it runs off-loop.
+                await asyncio.get_event_loop().run_in_executor(
+                    _DOCKER_EXECUTOR,
+                    self._put_bytes, container, file_path, content.encode('utf-8')
                 )
-                return success
-            finally:
-                # Clean up temporary file
-                os.unlink(temp_file_path)
-                
+
+                logger.debug(f"File written in container: {file_path}")
+                return True
+
         except Exception as e:
             logger.error(f"Error writing file in container: {str(e)}")
             return False
-    
+
+    async def write_files_in_container(self, container_id: str, files: Dict[str, str]) -> bool:
+        """
+        Write multiple files into the container with one archive push.
+
+        One tar stream covering every file replaces a put_archive HTTP
+        round-trip per file.
+
+        Args:
+            container_id: Container ID
+            files: Mapping of container path -> content
+
+        Returns:
+            True if write successful, False otherwise
+        """
+        try:
+            if not self.docker_client:
+                raise Exception("Docker client not available")
+
+            async with self._sem:
+                container = self._get_container(container_id)
+                await asyncio.get_event_loop().run_in_executor(
+                    _DOCKER_EXECUTOR,
+                    self._put_files, container,
+                    {path: content.encode('utf-8') for path, content in files.items()}
+                )
+
+                logger.debug(f"{len(files)} files written in container {container_id}")
+                return True
+
+        except Exception as e:
+            logger.error(f"Error writing files in container: {str(e)}")
+            return False
+
+    @staticmethod
+    def _put_bytes(container: Container, container_path: str, data: bytes):
+        """Write bytes to a single container path. See _put_files."""
+        DockerEnvironmentService._put_files(container, {container_path: data})
+
+    @staticmethod
+    def _put_files(container: Container, files: Dict[str, bytes]):
+        """Write byte payloads to container paths via one in-memory tar.
+
+        Builds the archive directly from the bytes, so generated files
+        reach the container with one HTTP call and no host-filesystem
+        round-trip. Parent directories ride along as DIRTYPE entries and
+        the archive is extracted at /, which replaces the mkdir -p exec
+        round-trip the old path needed.
+        """
+        mtime = int(datetime.utcnow().timestamp())
+        tar_buffer = io.BytesIO()
+        seen_dirs = set()
+        with tarfile.open(fileobj=tar_buffer, mode='w') as tar:
+            for container_path, data in files.items():
+                parent = ""
+                for part in container_path.lstrip("/").split("/")[:-1]:
+                    parent = f"{parent}/{part}" if parent else part
+                    if parent in seen_dirs:
+                        continue
+                    seen_dirs.add(parent)
+                    dir_info = tarfile.TarInfo(name=parent)
+                    dir_info.type = tarfile.DIRTYPE
+                    dir_info.mode = 0o755
+                    dir_info.mtime = mtime
+                    tar.addfile(dir_info)
+
+                info = tarfile.TarInfo(name=container_path.lstrip("/"))
+                info.size = len(data)
+                info.mtime = mtime
+                tar.addfile(info, io.BytesIO(data))
+
+        container.put_archive(path="/", data=tar_buffer.getbuffer())
+
+    async def get_file(self, container_id: str, file_path: str) -> bytes:
+        """
+        Read one file out of the container via the archive API.
+
+        A single HTTP GET replaces the cat exec round-trip: no shell,
+        no exec setup, no stdout encoding to undo.
+
+        Args:
+            container_id: Container ID
+            file_path: Absolute path of the file in the container
+
+        Returns:
+            File contents as bytes
+
+        Raises:
+            Exception: If the file does not exist or Docker is unavailable
+        """
+        if not self.docker_client:
+            raise Exception("Docker client not available")
+
+        async with self._sem:
+            container = self._get_container(container_id)
+            return await asyncio.get_event_loop().run_in_executor(
+                _DOCKER_EXECUTOR, self._get_file_sync, container, file_path
+            )
+
+    @staticmethod
+    def _get_file_sync(container: Container, file_path: str) -> bytes:
+        """Blocking body of get_file: fetch and unpack the one-file tar."""
+        stream, _ = container.get_archive(file_path)
+        buffer = io.BytesIO()
+        for chunk in stream:
+            buffer.write(chunk)
+        buffer.seek(0)
+        with tarfile.open(fileobj=buffer) as tar:
+            member = tar.getmembers()[0]
+            extracted = tar.extractfile(member)
+            if extracted is None:
+                raise Exception(f"Not a regular file: {file_path}")
+            return extracted.read()
+
     async def get_container_logs(self, container_id: str, tail: int = 100) -> str:
         """
         Get logs from a container.
@@ -435,14 +1062,72 @@ class DockerEnvironmentService:
             if not self.docker_client:
                 raise Exception("Docker client not available")
             
-            container = self.docker_client.containers.get(container_id)
-            logs = container.logs(tail=tail).decode('utf-8')
-            return logs
+            async with self._sem:
+                self._check_breaker()
+                container = self._get_container(container_id)
+                if isinstance(tail, int) and tail <= 1000:
+                    raw = await asyncio.get_event_loop().run_in_executor(
+                        _DOCKER_EXECUTOR, functools.partial(container.logs, tail=tail)
+                    )
+                    logs = raw.decode('utf-8')
+                else:
+                    # Large (or unbounded) tails: pull the blob in chunks
+                    # and decode incrementally rather than materializing
+                    # one bytes object the size of the whole log. The
+                    # chunked read blocks on the daemon socket, so it runs
+                    # off-loop like every other daemon call here.
+                    def _read_chunked():
+                        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+                        parts = [
+                            decoder.decode(chunk)
+                            for chunk in container.logs(tail=tail, stream=True, follow=False)
+                        ]
+                        parts.append(decoder.decode(b"", final=True))
+                        return "".join(parts)
+
+                    logs = await asyncio.get_event_loop().run_in_executor(
+                        _DOCKER_EXECUTOR, _read_chunked
+                    )
+                self._breaker_success()
+                return logs
             
         except Exception as e:
             logger.error(f"Error getting container logs: {str(e)}")
+            if isinstance(e, DockerException):
+                self._breaker_failure()
             return f"Error retrieving logs: {str(e)}"
     
+    async def stream_container_logs(self, container_id: str, tail: int = 100):
+        """
+        Stream logs from a container as decoded lines.
+
+        Args:
+            container_id: Container ID
+            tail: Number of lines to tail
+
+        Yields:
+            Log lines as strings, without materializing the full log
+        """
+        container = self._get_container(container_id)
+        stream = container.logs(tail=tail, stream=True, follow=False)
+        loop = asyncio.get_event_loop()
+
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        pending = ""
+        while True:
+            # The stream iterator blocks on the daemon socket, so advance
+            # it off-loop to keep the event loop responsive.
+            chunk = await loop.run_in_executor(_DOCKER_EXECUTOR, next, stream, None)
+            if chunk is None:
+                break
+            pending += decoder.decode(chunk)
+            while "\n" in pending:
+                line, pending = pending.split("\n", 1)
+                yield line
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            yield pending
+
     async def cleanup_container(self, container_id: str) -> bool:
         """
         Stop and remove a container.
@@ -457,23 +1142,30 @@ class DockerEnvironmentService:
             if not self.docker_client:
                 raise Exception("Docker client not available")
             
-            container = self.docker_client.containers.get(container_id)
-            
-            # Stop container
-            container.stop(timeout=10)
-            
-            # Remove container
-            container.remove(force=True)
+            async with self._sem:
+                self._check_breaker()
+                container = self._get_container(container_id)
+
+                # These containers run `tail -f /dev/null` and have no graceful
+                # shutdown to perform; remove(force=True) kills and removes in
+                # one daemon call instead of SIGTERM plus a 10s stop wait.
+                await asyncio.get_event_loop().run_in_executor(
+                    _DOCKER_EXECUTOR, functools.partial(container.remove, force=True)
+                )
             
-            # Remove from active containers
-            if container_id in self.active_containers:
-                del self.active_containers[container_id]
+                # Remove from active containers and drop the cached handle
+                self._untrack_container(container_id)
+                self._containers.pop(container_id, None)
             
-            logger.info(f"Container {container_id} cleaned up successfully")
-            return True
+                self._breaker_success()
+                logger.info(f"Container {container_id} cleaned up successfully")
+                return True
             
         except Exception as e:
             logger.error(f"Error cleaning up container {container_id}: {str(e)}")
+            if isinstance(e, DockerException):
+                self._ping_cache = (0.0, False)
+                self._breaker_failure()
             return False
     
     def get_container_info(self, container_id: str) -> Optional[ContainerInfo]:
@@ -481,28 +1173,62 @@ class DockerEnvironmentService:
         return self.active_containers.get(container_id)
     
     def list_active_containers(self) -> List[ContainerInfo]:
-        """List all active containers."""
-        return list(self.active_containers.values())
+        """List all active containers (contiguous, near creation order)."""
+        return list(self._container_list)
     
     async def cleanup_all_containers(self):
-        """Clean up all active containers."""
+        """Clean up all active containers and drain the warm pool."""
         try:
             container_ids = list(self.active_containers.keys())
-            
-            for container_id in container_ids:
-                await self.cleanup_container(container_id)
-            
+
+            # Cleanups target distinct containers and the daemon handles
+            # them concurrently, so fire them all at once: shutdown time
+            # is one cleanup latency instead of the sum of all of them.
+            results = await asyncio.gather(
+                *(self.cleanup_container(container_id) for container_id in container_ids),
+                return_exceptions=True
+            )
+            failed = sum(1 for r in results if r is not True)
+            if failed:
+                logger.warning(f"{failed} of {len(container_ids)} container cleanups failed")
+
+            # Drain pre-warmed containers so nothing leaks on shutdown
+            self._pool_target = 0
+            if self._pool_filler is not None:
+                self._pool_filler.cancel()
+            while not self._pool.empty():
+                container = self._pool.get_nowait()
+                try:
+                    container.remove(force=True)
+                except Exception as e:
+                    logger.warning(f"Error removing pooled container: {str(e)}")
+
             logger.info(f"Cleaned up {len(container_ids)} containers")
-            
+
         except Exception as e:
             logger.error(f"Error cleaning up all containers: {str(e)}")
     
+    _PING_TTL = 5.0  # seconds a ping result stays trusted
+
     def is_docker_available(self) -> bool:
-        """Check if Docker is available and accessible."""
+        """Check if Docker is available and accessible.
+
+        The result is cached for a short TTL; daemon failures elsewhere
+        invalidate the cache so a sick daemon is re-probed promptly.
+        """
+        now = time.monotonic()
+        ts, ok = self._ping_cache
+        if now - ts < self._PING_TTL:
+            return ok
+
         try:
             if self.docker_client:
                 self.docker_client.ping()
-                return True
-            return False
+                result = True
+            else:
+                result = False
         except Exception:
-            return False 
\ No newline at end of file
+            result = False
+
+        self._ping_cache = (now, result)
+        return result
\ No newline at end of file
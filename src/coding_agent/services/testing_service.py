@@ -10,20 +10,32 @@ This service provides comprehensive testing capabilities including:
 """
 
 import asyncio
+import functools
+import heapq
 import logging
 import os
+import shlex
+import sys
 import tempfile
 import shutil
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Tuple, Union
 from pathlib import Path
 import subprocess
 import json
 import uuid
 
+try:
+    # Rust JSON parser: several times faster than stdlib json on the
+    # large reports pytest-json-report emits. Optional — stdlib json
+    # remains the fallback when orjson is not installed.
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..models.testing import (
-    TestEnvironment, TestResults, TestDetail, 
-    EnvironmentStatus, TestType, TestSuite
+    TestEnvironment, TestResults, TestDetail,
+    EnvironmentStatus, TestType, TestSuite, CommandResult
 )
 from ..config.settings import get_settings
 from .docker_service import DockerEnvironmentService
@@ -44,6 +56,9 @@ class TestingService:
     5. Resource cleanup and management
     """
     
+    # Python version the prebaked test-base image is built from
+    _PREBAKED_PYTHON_VERSION = "3.9"
+
     def __init__(self):
         self.settings = get_settings()
         self.docker_service = DockerEnvironmentService()
@@ -52,7 +67,23 @@ class TestingService:
         # Ensure testing directory exists
         self.testing_base_path = os.path.join(self.settings.workspace_base_path, "testing")
         os.makedirs(self.testing_base_path, exist_ok=True)
-        
+
+        # Warm pool: finished prebaked environments are wiped and parked
+        # here instead of torn down, so the next task skips container
+        # creation entirely. Disabled when warm_pool_size is 0.
+        self._warm_pool: asyncio.Queue = asyncio.Queue()
+        self._warm_pool_size = self.settings.warm_pool_size
+
+        # Cached tuple view of active_environments for hot poll loops;
+        # dropped on every insert/remove. Environments mutate in place,
+        # so the view stays live between mutations.
+        self._env_list_cache: Optional[Tuple[TestEnvironment, ...]] = None
+
+        # Min-heap of (created_at, env_id): the expiry sweep pops only
+        # entries old enough to matter instead of scanning every
+        # environment each pass.
+        self._expiry_heap: List[Tuple[datetime, str]] = []
+
         logger.info("Testing service initialized")
     
     async def create_test_environment(
@@ -74,7 +105,23 @@ class TestingService:
         """
         try:
             logger.info(f"Creating test environment for task {task_id}")
-            
+
+            # Check out a recycled environment when one is parked: the
+            # container is already running with dependencies installed
+            if python_version == self._PREBAKED_PYTHON_VERSION:
+                try:
+                    environment = self._warm_pool.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+                else:
+                    environment.task_id = task_id
+                    environment.target_service = target_service
+                    environment.status = EnvironmentStatus.READY
+                    self.active_environments[environment.env_id] = environment
+                    self._env_list_cache = None
+                    logger.info(f"Reusing warm environment {environment.env_id} for task {task_id}")
+                    return environment
+
             # Generate unique environment ID
             env_id = f"test-env-{task_id}-{uuid.uuid4().hex[:8]}"
             
@@ -82,13 +129,18 @@ class TestingService:
             env_workspace = os.path.join(self.testing_base_path, env_id)
             os.makedirs(env_workspace, exist_ok=True)
             
+            # Resolve the container spec for this python version; the
+            # per-environment workspace mount stays outside the memoized
+            # part, so the cached entries are immutable
+            image, prebaked = self._container_spec(python_version)
+
             # Create Docker container for isolated testing
             container = await self.docker_service.create_container(
                 env_id=env_id,
-                image=f"python:{python_version}-slim",
+                image=image,
                 workspace_path=env_workspace
             )
-            
+
             # Create test environment object
             environment = TestEnvironment(
                 env_id=env_id,
@@ -98,11 +150,14 @@ class TestingService:
                 target_service=target_service,
                 python_version=python_version,
                 workspace_path=env_workspace,
+                base_image_prebaked=prebaked,
                 created_at=datetime.utcnow()
             )
             
             # Store in active environments
             self.active_environments[env_id] = environment
+            self._env_list_cache = None
+            heapq.heappush(self._expiry_heap, (environment.created_at, env_id))
             
             # If container creation succeeded, mark as ready
             if container:
@@ -134,6 +189,58 @@ class TestingService:
             )
             return environment
     
+    @functools.lru_cache(maxsize=32)
+    def _container_spec(self, python_version: str) -> Tuple[str, bool]:
+        """Resolve the (image, prebaked) pair for a python version.
+
+        Memoized: environment creation sits on the task hot path and
+        keeps asking for the same handful of versions, and the cached
+        tuple doubles as a hashable key for pool-style lookups. The
+        prebaked base image (docker/Dockerfile.test-base) already
+        carries the test toolchain, so container start is a cache hit
+        and the per-environment toolchain install is skipped.
+        """
+        prebaked = python_version == self._PREBAKED_PYTHON_VERSION
+        image = self.settings.test_base_image if prebaked else f"python:{python_version}-slim"
+        return image, prebaked
+
+    @staticmethod
+    def _set_status(environment: TestEnvironment, status: EnvironmentStatus):
+        """Apply a status transition, skipping writes that change nothing.
+
+        Status flips feed serialization and status endpoints elsewhere;
+        a no-op write has nothing to tell them, so it is dropped at the
+        source.
+        """
+        if environment.status is not status:
+            environment.status = status
+
+    async def create_test_environments_bulk(
+        self,
+        task_ids: List[str],
+        target_service: str = "market-predictor",
+        python_version: str = "3.9"
+    ) -> List[TestEnvironment]:
+        """
+        Create test environments for several tasks concurrently.
+
+        The underlying docker calls are already bounded by the docker
+        service's own concurrency semaphore, so queued tasks overlap
+        container creation instead of waiting in line.
+
+        Args:
+            task_ids: Task identifiers to create environments for
+            target_service: Target service name
+            python_version: Python version for the environments
+
+        Returns:
+            Created test environments, in task order
+        """
+        return list(await asyncio.gather(*(
+            self.create_test_environment(task_id, target_service, python_version)
+            for task_id in task_ids
+        )))
+
     async def install_dependencies(
         self, 
         environment: TestEnvironment, 
@@ -152,19 +259,18 @@ class TestingService:
             True if installation successful, False otherwise
         """
         try:
-            logger.info(f"Installing dependencies in environment {environment.env_id}")
+            logger.debug(f"Installing dependencies in environment {environment.env_id}")
             
             if environment.status != EnvironmentStatus.READY:
                 raise ValueError(f"Environment {environment.env_id} is not ready")
             
-            environment.status = EnvironmentStatus.INSTALLING_DEPS
-            
-            # Prepare installation commands
-            install_commands = []
-            
-            # Update pip first
-            install_commands.append("pip install --upgrade pip")
+            self._set_status(environment, EnvironmentStatus.INSTALLING_DEPS)
             
+            # Update pip first; everything else is batched into one
+            # install so pip resolves and downloads the whole set in a
+            # single process instead of one container exec per package
+            install_args = []
+
             # Install from requirements file if provided
             if requirements_file and os.path.exists(requirements_file):
                 container_req_path = "/app/requirements.txt"
@@ -174,52 +280,107 @@ class TestingService:
                     requirements_file,
                     container_req_path
                 )
-                install_commands.append(f"pip install -r {container_req_path}")
-            
+                install_args += ["-r", container_req_path]
+
             # Install additional packages
             if additional_packages:
-                for package in additional_packages:
-                    install_commands.append(f"pip install {package}")
-            
-            # Install testing dependencies
-            test_packages = [
-                "pytest>=7.4.0",
-                "pytest-asyncio>=0.21.0", 
-                "pytest-cov>=4.1.0",
-                "httpx>=0.25.0",
-                "requests>=2.31.0"
-            ]
-            
-            for package in test_packages:
-                install_commands.append(f"pip install {package}")
-            
+                install_args += additional_packages
+
+            # Install testing dependencies, unless the image already
+            # bakes them in (docker/Dockerfile.test-base)
+            if not environment.base_image_prebaked:
+                install_args += [
+                    "pytest>=7.4.0",
+                    "pytest-asyncio>=0.21.0",
+                    "pytest-cov>=4.1.0",
+                    "pytest-xdist>=3.3.0",
+                    "httpx>=0.25.0",
+                    "requests>=2.31.0"
+                ]
+
+            # With a wheelhouse mounted, installs resolve offline from
+            # local wheels; the pip self-upgrade is skipped since it
+            # would reach for PyPI and defeat the point
+            offline = bool(self.settings.wheelhouse_host_dir)
+
             # Execute installation commands
+            install_commands = [] if offline else ["pip install --upgrade pip"]
+            if install_args:
+                base_args = ["pip", "install", "--no-input", "--cache-dir", "/root/.cache/pip"]
+                if offline:
+                    base_args += ["--no-index", "--find-links", "/wheelhouse"]
+                install_commands.append(
+                    # Explicit --cache-dir pins pip to the shared host
+                    # cache volume mounted by the docker service
+                    " ".join(base_args + [shlex.quote(arg) for arg in install_args])
+                )
             for command in install_commands:
                 result = await self.docker_service.execute_command(
                     environment.container_id,
                     command,
-                    timeout=300  # 5 minutes timeout
+                    timeout=600  # the batched install covers every package
                 )
-                
+
                 if result.exit_code != 0:
                     error_msg = f"Failed to execute: {command}. Error: {result.stderr}"
                     environment.error_message = error_msg
-                    environment.status = EnvironmentStatus.FAILED
+                    self._set_status(environment, EnvironmentStatus.FAILED)
                     logger.error(error_msg)
                     return False
             
-            environment.status = EnvironmentStatus.READY
+            self._set_status(environment, EnvironmentStatus.READY)
             environment.dependencies_installed = True
-            logger.info(f"Dependencies installed successfully in {environment.env_id}")
+            logger.debug(f"Dependencies installed successfully in {environment.env_id}")
             return True
             
         except Exception as e:
             error_msg = f"Error installing dependencies: {str(e)}"
             environment.error_message = error_msg
-            environment.status = EnvironmentStatus.FAILED
+            self._set_status(environment, EnvironmentStatus.FAILED)
             logger.error(error_msg)
             return False
     
+    async def build_wheelhouse(self, requirements_file: str) -> bool:
+        """
+        Pre-download wheels for a requirements set into the wheelhouse.
+
+        Run once at startup (or whenever requirements change): every
+        test container then installs from the mounted directory at disk
+        speed, with no concurrent environments racing each other to
+        PyPI. No-op unless wheelhouse_host_dir is configured.
+
+        Args:
+            requirements_file: Host path of the requirements.txt to download
+
+        Returns:
+            True if the wheelhouse was (re)populated, False otherwise
+        """
+        wheelhouse = self.settings.wheelhouse_host_dir
+        if not wheelhouse:
+            return False
+
+        try:
+            os.makedirs(wheelhouse, exist_ok=True)
+            proc = await asyncio.create_subprocess_exec(
+                sys.executable, "-m", "pip", "download", "--no-input",
+                "-d", wheelhouse, "-r", requirements_file,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
+            )
+            _, stderr = await proc.communicate()
+            if proc.returncode != 0:
+                logger.error(
+                    f"Wheelhouse build failed: {stderr.decode('utf-8', errors='replace')[-500:]}"
+                )
+                return False
+
+            logger.info(f"Wheelhouse populated at {wheelhouse} from {requirements_file}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error building wheelhouse: {str(e)}")
+            return False
+
     async def start_target_service(
         self, 
         environment: TestEnvironment,
@@ -243,7 +404,7 @@ class TestingService:
             if environment.status != EnvironmentStatus.READY:
                 raise ValueError(f"Environment {environment.env_id} is not ready")
             
-            environment.status = EnvironmentStatus.STARTING_SERVICE
+            self._set_status(environment, EnvironmentStatus.STARTING_SERVICE)
             
             # Copy service code to container
             container_service_path = f"/app/{environment.target_service}"
@@ -263,19 +424,41 @@ class TestingService:
             )
             
             if result.success:
-                # Wait for service to start and check health
-                await asyncio.sleep(3)  # Give service time to start
-                
-                health_result = await self.docker_service.execute_command(
-                    environment.container_id,
-                    f"curl -s http://localhost:{port}/health || echo 'HEALTH_CHECK_FAILED'"
-                )
-                
-                if "HEALTH_CHECK_FAILED" not in health_result.stdout:
-                    environment.status = EnvironmentStatus.SERVICE_RUNNING
+                # Probe /health with exponential backoff instead of a
+                # fixed sleep: a fast boot is detected in tens of
+                # milliseconds, a slow one still gets ~6s before failing
+                startup_start = asyncio.get_event_loop().time()
+                ready = False
+                for delay in (0.05, 0.1, 0.2, 0.4, 0.8, 1.6, 3.2):
+                    await asyncio.sleep(delay)
+                    health_result = await self.docker_service.execute_command(
+                        environment.container_id,
+                        f"curl -sf http://localhost:{port}/health",
+                        timeout=5
+                    )
+                    if health_result.exit_code == 0:
+                        ready = True
+                        break
+
+                if ready:
+                    self._set_status(environment, EnvironmentStatus.SERVICE_RUNNING)
                     environment.service_port = port
                     environment.service_started = True
-                    logger.info(f"Service started successfully in {environment.env_id}")
+                    environment.service_startup_ms = (
+                        asyncio.get_event_loop().time() - startup_start
+                    ) * 1000
+                    logger.info(
+                        f"Service started successfully in {environment.env_id} "
+                        f"({environment.service_startup_ms:.0f}ms)"
+                    )
+
+                    # Snapshot the prepared state (deps + running service)
+                    # once; forks spun from it skip the whole setup path.
+                    # Best-effort: testing proceeds fine without it.
+                    environment.snapshot_image = await self.docker_service.snapshot_container(
+                        environment.container_id,
+                        tag=environment.env_id
+                    )
                     return True
                 else:
                     environment.error_message = "Service health check failed"
@@ -289,10 +472,64 @@ class TestingService:
         except Exception as e:
             error_msg = f"Error starting service: {str(e)}"
             environment.error_message = error_msg
-            environment.status = EnvironmentStatus.FAILED
+            self._set_status(environment, EnvironmentStatus.FAILED)
             logger.error(error_msg)
             return False
     
+    async def fork_environment(
+        self,
+        environment: TestEnvironment,
+        task_id: str
+    ) -> Optional[TestEnvironment]:
+        """
+        Spin a disposable sibling of a prepared environment.
+
+        Forks start from the snapshot taken after the target service
+        came up, so they are ready for run_test_suite in roughly the
+        time a container takes to start — no dependency install, no
+        service boot. Each fork is an independent environment: it is
+        tracked, cleaned up and expired like any other.
+
+        Args:
+            environment: Prepared environment with a snapshot taken
+            task_id: Task identifier for the fork
+
+        Returns:
+            The forked environment, or None if no snapshot exists or
+            the fork could not be created
+        """
+        if not environment.snapshot_image:
+            logger.warning(
+                f"Cannot fork environment {environment.env_id}: no snapshot taken"
+            )
+            return None
+
+        env_id = f"test-env-{task_id}-{uuid.uuid4().hex[:8]}"
+        container = await self.docker_service.fork_container(
+            environment.snapshot_image, env_id
+        )
+        if container is None:
+            return None
+
+        fork = TestEnvironment(
+            env_id=env_id,
+            task_id=task_id,
+            container_id=container.id,
+            status=EnvironmentStatus.READY,
+            target_service=environment.target_service,
+            python_version=environment.python_version,
+            base_image_prebaked=environment.base_image_prebaked,
+            dependencies_installed=environment.dependencies_installed,
+            service_port=environment.service_port,
+            service_started=environment.service_started,
+            created_at=datetime.utcnow()
+        )
+        self.active_environments[env_id] = fork
+        self._env_list_cache = None
+        heapq.heappush(self._expiry_heap, (fork.created_at, env_id))
+        logger.info(f"Forked environment {env_id} from {environment.env_id}")
+        return fork
+
     async def run_test_suite(
         self, 
         environment: TestEnvironment,
@@ -309,32 +546,30 @@ class TestingService:
             Test execution results
         """
         try:
-            logger.info(f"Running test suite in environment {environment.env_id}")
+            logger.debug(f"Running test suite in environment {environment.env_id}")
             
             if environment.status not in [EnvironmentStatus.READY, EnvironmentStatus.SERVICE_RUNNING]:
                 raise ValueError(f"Environment {environment.env_id} is not ready for testing")
             
-            environment.status = EnvironmentStatus.RUNNING_TESTS
+            self._set_status(environment, EnvironmentStatus.RUNNING_TESTS)
             
-            # Copy test files to container
-            for test_file_path, test_content in test_suite.test_files.items():
-                container_test_path = f"/app/tests/{os.path.basename(test_file_path)}"
-                await self.docker_service.write_file_in_container(
+            # Copy test and source files to the container in one archive
+            # push instead of one docker API call per file
+            container_files = {
+                f"/app/tests/{os.path.basename(test_file_path)}": test_content
+                for test_file_path, test_content in test_suite.test_files.items()
+            }
+            if test_suite.source_files:
+                container_files.update({
+                    f"/app/{os.path.basename(source_file_path)}": source_content
+                    for source_file_path, source_content in test_suite.source_files.items()
+                })
+            if container_files:
+                await self.docker_service.write_files_in_container(
                     environment.container_id,
-                    container_test_path,
-                    test_content
+                    container_files
                 )
             
-            # Copy source files if provided
-            if test_suite.source_files:
-                for source_file_path, source_content in test_suite.source_files.items():
-                    container_source_path = f"/app/{os.path.basename(source_file_path)}"
-                    await self.docker_service.write_file_in_container(
-                        environment.container_id,
-                        container_source_path,
-                        source_content
-                    )
-            
             # Execute test suite
             test_results = TestResults(
                 test_type=test_suite.test_type,
@@ -357,8 +592,8 @@ class TestingService:
             if test_results.started_at:
                 test_results.execution_time = (test_results.completed_at - test_results.started_at).total_seconds()
             
-            environment.status = EnvironmentStatus.READY
-            logger.info(f"Test suite completed in {environment.env_id}")
+            self._set_status(environment, EnvironmentStatus.READY)
+            logger.debug(f"Test suite completed in {environment.env_id}")
             
             return test_results
             
@@ -380,85 +615,147 @@ class TestingService:
                 completed_at=datetime.utcnow()
             )
     
+    # Output tail kept in memory per streamed test run; detailed results
+    # come from the JSON report, the tail only feeds the fallback path
+    _STREAM_TAIL_LIMIT = 64 * 1024
+
+    # Prebuilt argv pytest invocations: the exec-form list runs straight
+    # under runc with workdir=/app — no /bin/bash fork per test run and
+    # no shell-quoting pitfalls. Built once at class definition.
+    _PYTEST_BASE = [
+        "python", "-m", "pytest", "tests/", "-v", "--tb=short",
+        "--json-report", "--json-report-file=/tmp/test_results.json"
+    ]
+    _UNIT_TEST_CMD = _PYTEST_BASE
+    _INTEGRATION_TEST_CMD = _PYTEST_BASE + ["-k", "integration"]
+    _API_TEST_CMD = _PYTEST_BASE + ["-k", "api"]
+    # The full suite fans out across cores with pytest-xdist (baked into
+    # the test image); --dist loadfile keeps each file's tests on one
+    # worker so module-scoped fixtures aren't duplicated per test.
+    _ALL_TEST_CMD = _PYTEST_BASE + [
+        "-n", "auto", "--dist", "loadfile", "--cov=.", "--cov-report=json"
+    ]
+
+    async def _run_pytest(
+        self,
+        environment: TestEnvironment,
+        command: Union[str, List[str]],
+        timeout: int
+    ) -> CommandResult:
+        """Run a pytest command, streaming its output as it arrives.
+
+        Consumes the exec output chunk by chunk and keeps only the last
+        _STREAM_TAIL_LIMIT bytes, so a verbose multi-megabyte run no
+        longer sits in memory in full. Falls back to the buffered
+        execute_command when streaming is unavailable.
+        """
+        command_str = command if isinstance(command, str) else shlex.join(command)
+        tail = bytearray()
+        result: Optional[CommandResult] = None
+
+        async def _consume_stream():
+            nonlocal result
+            async for item in self.docker_service.execute_command_stream(
+                environment.container_id, command
+            ):
+                if isinstance(item, CommandResult):
+                    result = item
+                    break
+                tail.extend(item)
+                if len(tail) > self._STREAM_TAIL_LIMIT:
+                    del tail[:len(tail) - self._STREAM_TAIL_LIMIT]
+
+        try:
+            # wait_for rather than asyncio.timeout: the dev image runs
+            # python 3.9, where asyncio.timeout does not exist and the
+            # AttributeError would be swallowed into the buffered
+            # fallback on every single run
+            await asyncio.wait_for(_consume_stream(), timeout)
+        except asyncio.TimeoutError:
+            return CommandResult(
+                exit_code=124,
+                stdout=tail.decode('utf-8', errors='replace'),
+                stderr=f"Command timed out after {timeout} seconds",
+                command=command_str,
+                duration_seconds=timeout
+            )
+        except Exception:
+            return await self.docker_service.execute_command(
+                environment.container_id, command, timeout=timeout
+            )
+
+        if result is None:
+            result = CommandResult(exit_code=1, command=command_str)
+        result.stdout = tail.decode('utf-8', errors='replace')
+        return result
+
     async def _run_unit_tests(self, environment: TestEnvironment, results: TestResults):
         """Run unit tests in the environment."""
-        # Execute pytest for unit tests - use /bin/bash -c to ensure proper command execution
-        command = "/bin/bash -c 'cd /app && python -m pytest tests/ -v --tb=short --json-report --json-report-file=/tmp/test_results.json'"
-        
-        exec_result = await self.docker_service.execute_command(
-            environment.container_id,
-            command,
-            timeout=300
-        )
-        
+        exec_result = await self._run_pytest(environment, self._UNIT_TEST_CMD, timeout=300)
+
         await self._parse_test_results(environment, exec_result, results)
-    
+
     async def _run_integration_tests(self, environment: TestEnvironment, results: TestResults):
         """Run integration tests in the environment."""
-        # Execute pytest for integration tests
-        command = "/bin/bash -c 'cd /app && python -m pytest tests/ -k integration -v --tb=short --json-report --json-report-file=/tmp/test_results.json'"
-        
-        exec_result = await self.docker_service.execute_command(
-            environment.container_id,
-            command,
-            timeout=600
-        )
-        
+        exec_result = await self._run_pytest(environment, self._INTEGRATION_TEST_CMD, timeout=600)
+
         await self._parse_test_results(environment, exec_result, results)
-    
+
     async def _run_api_tests(self, environment: TestEnvironment, results: TestResults):
         """Run API tests in the environment."""
-        # Execute pytest for API tests
-        command = "/bin/bash -c 'cd /app && python -m pytest tests/ -k api -v --tb=short --json-report --json-report-file=/tmp/test_results.json'"
-        
-        exec_result = await self.docker_service.execute_command(
-            environment.container_id,
-            command,
-            timeout=600
-        )
-        
+        exec_result = await self._run_pytest(environment, self._API_TEST_CMD, timeout=600)
+
         await self._parse_test_results(environment, exec_result, results)
-    
+
     async def _run_all_tests(self, environment: TestEnvironment, results: TestResults):
-        """Run all tests in the environment."""
-        # Execute complete test suite
-        command = "/bin/bash -c 'cd /app && python -m pytest tests/ -v --tb=short --cov=. --cov-report=json --json-report --json-report-file=/tmp/test_results.json'"
-        
-        exec_result = await self.docker_service.execute_command(
-            environment.container_id,
-            command,
-            timeout=900
-        )
-        
+        """Run the complete test suite in the environment."""
+        exec_result = await self._run_pytest(environment, self._ALL_TEST_CMD, timeout=900)
+
         await self._parse_test_results(environment, exec_result, results)
     
     async def _parse_test_results(self, environment: TestEnvironment, exec_result, results: TestResults):
         """Parse test execution results."""
         try:
-            # Try to get JSON results file
-            json_result = await self.docker_service.execute_command(
-                environment.container_id,
-                "cat /tmp/test_results.json",
-                timeout=30
-            )
-            
-            if json_result.exit_code == 0:
-                test_data = json.loads(json_result.stdout)
+            # Fetch the JSON results file through the archive API: one
+            # HTTP GET instead of a cat exec with stdout re-encoding
+            raw_results: Optional[bytes] = None
+            try:
+                raw_results = await self.docker_service.get_file(
+                    environment.container_id,
+                    "/tmp/test_results.json"
+                )
+            except Exception:
+                # Fall back to the shell path (e.g. file missing or
+                # archive API unavailable)
+                json_result = await self.docker_service.execute_command(
+                    environment.container_id,
+                    "cat /tmp/test_results.json",
+                    timeout=30
+                )
+                if json_result.exit_code == 0:
+                    raw_results = json_result.stdout.encode('utf-8')
+
+            if raw_results is not None:
+                test_data = orjson.loads(raw_results) if orjson else json.loads(raw_results)
                 
                 results.passed = test_data.get("summary", {}).get("passed", 0)
                 results.failed = test_data.get("summary", {}).get("failed", 0)
                 results.skipped = test_data.get("summary", {}).get("skipped", 0)
                 results.total = results.passed + results.failed + results.skipped
                 
-                # Parse individual test details
-                for test in test_data.get("tests", []):
-                    detail = TestDetail(
+                # Parse individual test details into a preallocated list:
+                # append-driven growth reallocates repeatedly on the
+                # thousands of entries a large run produces
+                tests = test_data.get("tests", [])
+                details = [None] * len(tests)
+                for i, test in enumerate(tests):
+                    details[i] = TestDetail(
                         test_name=test.get("nodeid", "unknown"),
                         status="passed" if test.get("outcome") == "passed" else "failed",
                         duration_seconds=test.get("duration", 0),
                         error_message=test.get("longrepr") if test.get("outcome") != "passed" else None
                     )
-                    results.test_details.append(detail)
+                results.test_details = details
                 
                 results.success = results.failed == 0
             else:
@@ -492,18 +789,43 @@ class TestingService:
         """
         try:
             logger.info(f"Cleaning up environment {environment.env_id}")
-            
+
+            # Recycle into the warm pool instead of tearing down when
+            # there's room: the next task then starts on a running,
+            # fully-provisioned container
+            if self._can_recycle(environment):
+                if await self._recycle_environment(environment):
+                    return True
+
             # Stop and remove Docker container
             if environment.container_id:
                 await self.docker_service.cleanup_container(environment.container_id)
-            
-            # Remove workspace directory
+
+            # Drop the snapshot image so committed layers don't pile up
+            if environment.snapshot_image:
+                await self.docker_service.remove_image(environment.snapshot_image)
+                environment.snapshot_image = None
+
+            # Remove workspace directory off the event loop: a big tree
+            # of test artifacts would otherwise block every coroutine
+            # for the duration of the walk
             if environment.workspace_path and os.path.exists(environment.workspace_path):
-                shutil.rmtree(environment.workspace_path, ignore_errors=True)
+                if sys.platform.startswith('win'):
+                    await asyncio.get_running_loop().run_in_executor(
+                        None, shutil.rmtree, environment.workspace_path, True
+                    )
+                else:
+                    proc = await asyncio.create_subprocess_exec(
+                        "rm", "-rf", environment.workspace_path,
+                        stdout=asyncio.subprocess.DEVNULL,
+                        stderr=asyncio.subprocess.DEVNULL
+                    )
+                    await proc.wait()
             
             # Remove from active environments
             if environment.env_id in self.active_environments:
                 del self.active_environments[environment.env_id]
+                self._env_list_cache = None
             
             environment.status = EnvironmentStatus.CLEANED_UP
             logger.info(f"Environment {environment.env_id} cleaned up successfully")
@@ -513,29 +835,99 @@ class TestingService:
             logger.error(f"Error cleaning up environment {environment.env_id}: {str(e)}")
             return False
     
+    def _can_recycle(self, environment: TestEnvironment) -> bool:
+        """Whether a finished environment is safe to park for reuse."""
+        return (
+            self._warm_pool.qsize() < self._warm_pool_size
+            and environment.base_image_prebaked
+            and environment.container_id is not None
+            and environment.status != EnvironmentStatus.FAILED
+        )
+
+    async def _recycle_environment(self, environment: TestEnvironment) -> bool:
+        """Wipe an environment's state and park it in the warm pool.
+
+        Returns False if the wipe fails — the caller then falls through
+        to a full teardown.
+        """
+        try:
+            result = await self.docker_service.execute_command(
+                environment.container_id,
+                "/bin/bash -c 'rm -rf /app/* /tmp/test_results.json && mkdir -p /app/tests /app/src'",
+                timeout=30
+            )
+            if result.exit_code != 0:
+                return False
+
+            # The wipe invalidated any snapshot of this container's state
+            if environment.snapshot_image:
+                await self.docker_service.remove_image(environment.snapshot_image)
+                environment.snapshot_image = None
+
+            self.active_environments.pop(environment.env_id, None)
+            self._env_list_cache = None
+            environment.status = EnvironmentStatus.READY
+            environment.service_port = None
+            environment.service_started = False
+            environment.error_message = None
+            self._warm_pool.put_nowait(environment)
+            logger.info(f"Environment {environment.env_id} recycled into warm pool")
+            return True
+
+        except Exception as e:
+            logger.warning(f"Could not recycle environment {environment.env_id}: {str(e)}")
+            return False
+
     def get_environment_status(self, env_id: str) -> Optional[TestEnvironment]:
         """Get the status of a test environment."""
         return self.active_environments.get(env_id)
     
     def list_active_environments(self) -> List[TestEnvironment]:
         """List all active test environments."""
-        return list(self.active_environments.values())
+        # Rebuild the view only after a mutation; repeated polls between
+        # mutations copy a cached tuple instead of re-scanning the dict
+        if self._env_list_cache is None:
+            self._env_list_cache = tuple(self.active_environments.values())
+        return list(self._env_list_cache)
     
     async def cleanup_expired_environments(self, max_age_hours: int = 24):
         """Clean up environments older than specified age."""
         try:
             current_time = datetime.utcnow()
+            cutoff = current_time - timedelta(hours=max_age_hours)
             expired_envs = []
-            
-            for env in self.active_environments.values():
-                if env.created_at:
-                    age = current_time - env.created_at
-                    if age > timedelta(hours=max_age_hours):
-                        expired_envs.append(env)
-            
-            for env in expired_envs:
-                await self.cleanup_environment(env)
-                
+
+            # Deadline heap: pop only entries past the cutoff and stop at
+            # the first fresh one, instead of scanning every environment.
+            # Stale heap entries (already cleaned up) just fall out.
+            while self._expiry_heap and self._expiry_heap[0][0] <= cutoff:
+                _, env_id = heapq.heappop(self._expiry_heap)
+                env = self.active_environments.get(env_id)
+                if env is not None:
+                    expired_envs.append(env)
+
+            # Retire warm-pool entries past the age bound too, so stale
+            # containers get rebuilt instead of recycled forever
+            keep = []
+            while not self._warm_pool.empty():
+                env = self._warm_pool.get_nowait()
+                if env.created_at and current_time - env.created_at > timedelta(hours=max_age_hours):
+                    env.base_image_prebaked = False  # force real teardown
+                    expired_envs.append(env)
+                else:
+                    keep.append(env)
+            for env in keep:
+                self._warm_pool.put_nowait(env)
+
+            # Cleanups are independent docker calls: run them
+            # concurrently so N teardowns cost about one teardown of
+            # wall time instead of N
+            if expired_envs:
+                await asyncio.gather(
+                    *(self.cleanup_environment(env) for env in expired_envs),
+                    return_exceptions=True
+                )
+
             if expired_envs:
                 logger.info(f"Cleaned up {len(expired_envs)} expired environments")
                 
@@ -0,0 +1,274 @@
+"""
+Shared pytest fixtures for the test suite.
+
+Session-scoped fixtures live here so expensive setup — the FastAPI
+app lifespan, service construction — runs once per session instead of
+once per test.
+"""
+
+import copy
+import os
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock, Mock, create_autospec, patch
+
+# Application and service imports live inside the fixtures that need
+# them: the import chains (FastAPI app, docker SDK, LangChain) are the
+# bulk of collection time, and pytest --collect-only / --lf should not
+# pay for fixtures no selected test uses.
+
+# Settings loads every value from the environment / .env with no
+# defaults; seed placeholders so the suite runs without a local .env
+# (which is untracked — copy .env.example and fill in real values for
+# live runs). setdefault keeps any real environment intact.
+_SETTINGS_PLACEHOLDERS = {
+    "ENVIRONMENT": "development",
+    "LOG_LEVEL": "INFO",
+    "DEBUG_MODE": "true",
+    "AGENT_NAME": "coding-ai-agent",
+    "AGENT_PORT": "8002",
+    "SERVICE_NAME": "coding-ai-agent",
+    "SERVICE_VERSION": "0.1.0",
+    "LLM_PROVIDER": "openai",
+    "LLM_MODEL": "gpt-4",
+    "LLM_TEMPERATURE": "0.1",
+    "LLM_MAX_TOKENS": "4000",
+    "LLM_TIMEOUT": "120",
+    "OPENAI_API_KEY": "sk-test-placeholder",
+    "WORKSPACE_BASE_PATH": "/tmp/coding-agent-workspaces",
+    "MAX_CONCURRENT_TASKS": "3",
+    "WORKFLOW_TIMEOUT": "1800",
+    "TESTING_TIMEOUT": "600",
+    "GITHUB_USER_NAME": "Coding AI Agent",
+    "GITHUB_USER_EMAIL": "coding-agent@example.com",
+    "GITHUB_TOKEN": "ghp-test-placeholder",
+    "TARGET_REPOSITORIES": "example/market-predictor",
+    "CORS_ORIGINS": "*",
+}
+for _key, _value in _SETTINGS_PLACEHOLDERS.items():
+    os.environ.setdefault(_key, _value)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient (and one app lifespan) shared by every test."""
+    from src.coding_agent.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client():
+    """One httpx.AsyncClient over in-process ASGI transport.
+
+    For endpoint tests that need real async behavior: the client (and
+    its connection pool / anyio task group) is shared by the whole
+    session instead of rebuilt per test.
+    """
+    from src.coding_agent.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://test"
+    ) as async_test_client:
+        yield async_test_client
+
+
+@pytest.fixture(scope="session")
+def shared_workflow_engine():
+    """One WorkflowEngine for the session; construction wires up the
+    AI orchestrator and services, so it's too expensive to repeat for
+    tests that only exercise pure methods."""
+    from src.coding_agent.core.workflow_engine import WorkflowEngine
+
+    return WorkflowEngine()
+
+
+@pytest.fixture(scope="session")
+def shared_git_service():
+    """One GitService for the session, for pure generator methods."""
+    from src.coding_agent.services.git_service import GitService
+
+    return GitService()
+
+
+@pytest.fixture
+def workflow_engine(shared_workflow_engine):
+    """Per-test view of the shared engine.
+
+    A shallow copy with its own active_workflows dict: tests may
+    re-wire ai_orchestrator/git_service and start workflows without
+    touching the session instance.
+    """
+    engine = copy.copy(shared_workflow_engine)
+    engine.active_workflows = {}
+    engine._completion_events = {}
+    engine._milestone_events = {}
+    # The state-machine handlers are methods bound to the session
+    # instance; rebind them so dispatch sees the copy's (possibly
+    # mocked) services.
+    engine.state_handlers = {
+        state: getattr(engine, handler.__func__.__name__)
+        for state, handler in engine.state_handlers.items()
+    }
+    return engine
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    """Install FakeChatOpenAI for agents constructed during the test.
+
+    Tests register canned completions with fake_llm.register_response;
+    the registry is cleared on teardown so responses never leak.
+    """
+    from tests import fake_llm as fake_llm_module
+
+    monkeypatch.setattr(
+        'src.coding_agent.agents.coding_agents.ChatOpenAI',
+        fake_llm_module.FakeChatOpenAI
+    )
+    try:
+        yield fake_llm_module
+    finally:
+        fake_llm_module.clear_registry()
+
+
+@pytest.fixture(scope="session")
+def docker_available(request):
+    """Whether a Docker daemon answers, probed once and memoized in
+    the pytest cache so repeated runs skip the socket round-trip.
+    Delete .pytest_cache (or run with --cache-clear) after changing
+    the local Docker setup."""
+    cached = request.config.cache.get("coding_agent/docker_available", None)
+    if cached is not None:
+        return cached
+    try:
+        import docker
+        docker.from_env().ping()
+        available = True
+    except Exception:
+        available = False
+    request.config.cache.set("coding_agent/docker_available", available)
+    return available
+
+
+@pytest.fixture(scope="session")
+def _shared_testing_service():
+    """One TestingService for the session; docker.from_env is patched
+    during construction so no daemon is contacted."""
+    from src.coding_agent.services.testing_service import TestingService
+
+    with patch('docker.from_env'):
+        return TestingService()
+
+
+@pytest.fixture
+def testing_service(_shared_testing_service):
+    """Per-test view of the session TestingService with its mutable
+    state (environment tracking, expiry heap, list cache) cleared."""
+    service = _shared_testing_service
+    service.active_environments.clear()
+    service._expiry_heap.clear()
+    service._env_list_cache = None
+    return service
+
+
+@pytest.fixture(scope="session")
+def _shared_docker_service():
+    """One DockerEnvironmentService for the session, built against a
+    mocked docker client."""
+    from src.coding_agent.services.docker_service import DockerEnvironmentService
+
+    with patch('docker.from_env') as mock_from_env:
+        mock_client = Mock()
+        mock_client.ping.return_value = True
+        mock_from_env.return_value = mock_client
+        return DockerEnvironmentService()
+
+
+@pytest.fixture
+def docker_service(_shared_docker_service):
+    """Per-test view of the session docker service: a fresh mock
+    client (so configured return values never leak between tests) and
+    emptied container tracking."""
+    service = _shared_docker_service
+    service.docker_client = Mock()
+    service.docker_client.ping.return_value = True
+    service.active_containers.clear()
+    service._container_list.clear()
+    service._container_index.clear()
+    # Container handles cached from the previous test's client would
+    # shadow lookups against the fresh one; the ping cache likewise
+    # belongs to the replaced client
+    service._containers.clear()
+    service._ping_cache = (0.0, True)
+    # Failures a previous test provoked must not leave the circuit
+    # breaker open for this one
+    service._breaker_failures = 0
+    service._breaker_open_until = 0.0
+    return service
+
+
+@pytest.fixture(scope="session")
+def _mock_docker_service_template():
+    """Autospecced DockerEnvironmentService mock, built once per session.
+
+    The class walk is the expensive part, and autospec makes every
+    async method an awaitable AsyncMock with the real signature —
+    no hand-attached method mocks to drift from the class. Tests get
+    it through mock_docker_service, which resets state first.
+    """
+    from src.coding_agent.services.docker_service import DockerEnvironmentService
+
+    return create_autospec(DockerEnvironmentService, instance=True, spec_set=True)
+
+
+@pytest.fixture
+def mock_docker_service(_mock_docker_service_template):
+    """Per-test mock docker service: calls, return values and side
+    effects are cleared, then the default of an unavailable archive
+    API is restored so result parsing exercises the cat fallback."""
+    service = _mock_docker_service_template
+    service.reset_mock(return_value=True, side_effect=True)
+    service.get_file.side_effect = Exception("file not found")
+    # Streaming is likewise unavailable by default: a MagicMock
+    # async-iterates as empty, which would look like a silent zero-
+    # output run instead of driving the buffered execute_command path
+    # the tests actually stub
+    service.execute_command_stream.side_effect = Exception("streaming unavailable")
+    return service
+
+
+@pytest.fixture(scope="session")
+def _engine_spec():
+    """Autospecced WorkflowEngine mock, built once per session.
+
+    Autospec walks the class once so async methods become awaitable
+    AsyncMocks matching the real signatures — a bare Mock() can't be
+    awaited by the endpoints.
+    """
+    from src.coding_agent.core.workflow_engine import WorkflowEngine
+
+    return create_autospec(WorkflowEngine, instance=True)
+
+
+@pytest.fixture
+def mock_workflow_engine(_engine_spec):
+    """Mock workflow engine injected via FastAPI dependency overrides.
+
+    The session spec is reset (including return values) before each
+    test and the override removed afterwards, so nothing leaks; only
+    the spec construction cost is shared.
+    """
+    from src.coding_agent.main import app, get_workflow_engine
+
+    _engine_spec.reset_mock(return_value=True, side_effect=True)
+    app.dependency_overrides[get_workflow_engine] = lambda: _engine_spec
+    try:
+        yield _engine_spec
+    finally:
+        app.dependency_overrides.pop(get_workflow_engine, None)
@@ -0,0 +1,43 @@
+"""
+Fake ChatOpenAI stub for tests.
+
+Implements the slice of the ChatOpenAI surface the agents actually
+use — construction plus invoke() — and answers from a canned-response
+registry, so tests register completions instead of patching Mock
+graphs that drift from the real call interface.
+"""
+
+from types import SimpleNamespace
+from typing import Any, Dict
+
+
+DEFAULT_RESPONSE = SimpleNamespace(content="")
+
+_REGISTRY: Dict[str, Any] = {}
+
+
+def register_response(key: str, content: str):
+    """Register a canned completion, returned when the rendered prompt
+    contains ``key``."""
+    _REGISTRY[key] = SimpleNamespace(content=content)
+
+
+def clear_registry():
+    """Drop all registered responses (fixture teardown)."""
+    _REGISTRY.clear()
+
+
+class FakeChatOpenAI:
+    """Stand-in for ChatOpenAI: answers invoke() from the registry."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def invoke(self, messages):
+        prompt_text = " ".join(
+            getattr(message, "content", "") for message in messages
+        )
+        for key, response in _REGISTRY.items():
+            if key in prompt_text:
+                return response
+        return DEFAULT_RESPONSE
@@ -6,26 +6,78 @@ of the Coding AI Agent service.
 """
 
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import Mock, patch
+from datetime import datetime
+
+from pydantic import TypeAdapter, ValidationError
 
-from src.coding_agent.main import app
 from src.coding_agent.models.requests import CodingRequest
+from src.coding_agent.models.responses import (
+    CodingResponse, TaskStatusResponse, TaskStatus
+)
+
+# Frozen timestamp for mock responses: none of these tests assert on
+# time, so there is no need to read the clock per mock object.
+_NOW = datetime(2024, 1, 1)
+
+# Compiled validator built once at import; parametrized validation
+# cases share it instead of paying the schema build per case.
+_CODING_REQUEST_ADAPTER = TypeAdapter(CodingRequest)
+
+# The client and mock_workflow_engine fixtures are shared from
+# conftest.py: one TestClient (and one app lifespan) serves the whole
+# session, while the engine mock stays per-test.
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI application."""
-    with TestClient(app) as test_client:
-        yield test_client
+@pytest.fixture(scope="session")
+def initiated_response():
+    """Canned workflow response; model_construct skips validation the
+    trusted fixture values don't need, and the instance is shared for
+    the session (tests only read it)."""
+    return CodingResponse.model_construct(
+        task_id="task_abc123def",
+        status=TaskStatus.INITIATED,
+        branch_name="test-feature-abc123",
+        estimated_duration="5-10 minutes",
+        created_at=_NOW,
+        updated_at=_NOW,
+        progress_percentage=0,
+        current_step="Initializing workflow",
+        workflow_steps=[]
+    )
 
 
-@pytest.fixture
-def mock_workflow_engine():
-    """Mock workflow engine for testing."""
-    mock_engine = Mock()
-    with patch('src.coding_agent.main.get_workflow_engine', return_value=mock_engine):
-        yield mock_engine
+@pytest.fixture(scope="session")
+def coding_status_response():
+    """Canned in-progress task status, built once per session."""
+    return TaskStatusResponse.model_construct(
+        task_id="task_abc123def",
+        status=TaskStatus.CODING,
+        created_at=_NOW,
+        updated_at=_NOW,
+        progress_percentage=60,
+        current_step="Generating code implementation",
+        workflow_steps=[],
+        code_changes=[],
+        test_results=[],
+        validation_results=[]
+    )
+
+
+@pytest.fixture(scope="session")
+def completed_status_response():
+    """Canned completed task status, built once per session."""
+    return TaskStatusResponse.model_construct(
+        task_id="task_abc123def",
+        status=TaskStatus.COMPLETED,
+        created_at=_NOW,
+        updated_at=_NOW,
+        progress_percentage=100,
+        current_step="Workflow completed successfully",
+        workflow_steps=[],
+        code_changes=[],
+        test_results=[],
+        validation_results=[]
+    )
 
 
 class TestHealthEndpoint:
@@ -80,25 +132,9 @@ class TestRootEndpoint:
 class TestCodingEndpoint:
     """Test the main coding endpoint."""
     
-    def test_coding_endpoint_valid_request(self, client, mock_workflow_engine):
+    def test_coding_endpoint_valid_request(self, client, mock_workflow_engine, initiated_response):
         """Test coding endpoint with valid request."""
-        # Mock the workflow engine response
-        from src.coding_agent.models.responses import CodingResponse, TaskStatus
-        from datetime import datetime
-        
-        mock_response = CodingResponse(
-            task_id="task_abc123def",
-            status=TaskStatus.INITIATED,
-            branch_name="test-feature-abc123",
-            estimated_duration="5-10 minutes",
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-            progress_percentage=0,
-            current_step="Initializing workflow",
-            workflow_steps=[]
-        )
-        
-        mock_workflow_engine.start_coding_workflow.return_value = mock_response
+        mock_workflow_engine.start_coding_workflow.return_value = initiated_response
         
         # Test request
         request_data = {
@@ -139,25 +175,9 @@ class TestCodingEndpoint:
 class TestTaskStatusEndpoint:
     """Test the task status endpoint."""
     
-    def test_task_status_existing_task(self, client, mock_workflow_engine):
+    def test_task_status_existing_task(self, client, mock_workflow_engine, coding_status_response):
         """Test getting status for existing task."""
-        from src.coding_agent.models.responses import TaskStatusResponse, TaskStatus
-        from datetime import datetime
-        
-        mock_status = TaskStatusResponse(
-            task_id="task_abc123def",
-            status=TaskStatus.CODING,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-            progress_percentage=60,
-            current_step="Generating code implementation",
-            workflow_steps=[],
-            code_changes=[],
-            test_results=[],
-            validation_results=[]
-        )
-        
-        mock_workflow_engine.get_task_status.return_value = mock_status
+        mock_workflow_engine.get_task_status.return_value = coding_status_response
         
         response = client.get("/api/v1/code/task_abc123def/status")
         assert response.status_code == 200
@@ -174,25 +194,9 @@ class TestTaskStatusEndpoint:
         response = client.get("/api/v1/code/nonexistent_task/status")
         assert response.status_code == 404
     
-    def test_task_status_with_parameters(self, client, mock_workflow_engine):
+    def test_task_status_with_parameters(self, client, mock_workflow_engine, completed_status_response):
         """Test task status with query parameters."""
-        from src.coding_agent.models.responses import TaskStatusResponse, TaskStatus
-        from datetime import datetime
-        
-        mock_status = TaskStatusResponse(
-            task_id="task_abc123def",
-            status=TaskStatus.COMPLETED,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-            progress_percentage=100,
-            current_step="Workflow completed successfully",
-            workflow_steps=[],
-            code_changes=[],
-            test_results=[],
-            validation_results=[]
-        )
-        
-        mock_workflow_engine.get_task_status.return_value = mock_status
+        mock_workflow_engine.get_task_status.return_value = completed_status_response
         
         response = client.get("/api/v1/code/task_abc123def/status?include_logs=true&include_files=true")
         assert response.status_code == 200
@@ -249,27 +253,21 @@ class TestTaskListEndpoint:
 
 class TestRequestValidation:
     """Test request validation logic."""
-    
-    def test_coding_request_validation(self):
+
+    @pytest.mark.parametrize("payload,ok", [
+        ({"requirements": "Add a /api/v1/status endpoint that returns current timestamp and uptime",
+          "target_service": "market-predictor", "priority": "medium"}, True),
+        ({"requirements": "fix",  # Too vague
+          "target_service": "market-predictor"}, False),
+        ({"requirements": "make better improve",  # All vague words
+          "target_service": "market-predictor"}, False),
+    ])
+    def test_coding_request_validation(self, payload, ok):
         """Test CodingRequest model validation."""
-        # Valid request
-        valid_request = CodingRequest(
-            requirements="Add a /api/v1/status endpoint that returns current timestamp and uptime",
-            target_service="market-predictor",
-            priority="medium"
-        )
-        assert valid_request.requirements is not None
-        assert valid_request.target_service == "market-predictor"
-        
-        # Test validation errors
-        with pytest.raises(ValueError):
-            CodingRequest(
-                requirements="fix",  # Too vague
-                target_service="market-predictor"
-            )
-        
-        with pytest.raises(ValueError):
-            CodingRequest(
-                requirements="make better improve",  # All vague words
-                target_service="market-predictor"
-            )
\ No newline at end of file
+        if ok:
+            request = _CODING_REQUEST_ADAPTER.validate_python(payload)
+            assert request.requirements is not None
+            assert request.target_service == payload["target_service"]
+        else:
+            with pytest.raises(ValidationError):
+                _CODING_REQUEST_ADAPTER.validate_python(payload)
\ No newline at end of file
@@ -10,49 +10,83 @@ This module tests the complete testing infrastructure including:
 
 import pytest
 import asyncio
+import json
 import os
 import tempfile
+import threading
 from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, AsyncMock
 
-from src.coding_agent.services.testing_service import TestingService
-from src.coding_agent.services.docker_service import DockerEnvironmentService
 from src.coding_agent.models.testing import (
     TestEnvironment, TestSuite, TestType, TestResults,
-    EnvironmentStatus, TestEnvironmentRequest
+    EnvironmentStatus, TestEnvironmentRequest, CommandResult
 )
-from src.coding_agent.core.workflow_engine import WorkflowEngine, WorkflowContext
 from src.coding_agent.models.requests import CodingRequest
 
+# The service and engine imports are deferred into the tests that use
+# them: their chains (docker SDK, LangChain via the agents) dominate
+# collection time.
+
+
+# Attribute-only stand-ins, frozen at module scope: nothing asserts
+# calls on these, so one shared instance serves every run.
+_READY_CONTAINER = SimpleNamespace(
+    id="test_container_123", name="coding-agent-test-env", status="running"
+)
+_EXEC_OK = SimpleNamespace(exit_code=0)
+
+# Results for a successful pytest run inside the container: the test
+# execution itself, then the json-report readback. Serializing the
+# report from a dict keeps the contract explicit and spares the test
+# a hand-escaped literal.
+_JSON_REPORT = {
+    "summary": {"passed": 5, "failed": 0, "skipped": 1},
+    "tests": [
+        {"nodeid": "test_file.py::test_function", "outcome": "passed", "duration": 0.1}
+    ],
+}
+_TEST_RUN_RESULTS = (
+    SimpleNamespace(exit_code=0, stdout="All tests passed", stderr=""),
+    SimpleNamespace(exit_code=0, stdout=json.dumps(_JSON_REPORT)),
+)
+
+
+# CodingRequest validated once at import; tests take model_copy()s,
+# which skip re-validation.
+_REQUEST_TEMPLATE = CodingRequest(
+    requirements="Add a comprehensive test endpoint for status monitoring",
+    target_service="market-predictor"
+)
+
+
+# Expected workflow statistics, compared as one dict per test so a
+# mismatch reports every deviating key at once.
+_EXPECTED_TESTING_STATS = {
+    "testing_completed": True,
+    "tests_passed": 3,
+    "tests_failed": 0,
+    "test_coverage": 95.0,
+}
+
+_EXPECTED_FAILURE_STATS = {
+    "testing_completed": True,
+    "tests_passed": 2,
+    "tests_failed": 1,
+    "test_failures_ignored": True,
+}
+
 
 class TestTestingService:
     """Test the core testing service functionality."""
-    
-    @pytest.fixture
-    def testing_service(self):
-        """Create a testing service instance for tests."""
-        with patch('docker.from_env'):
-            return TestingService()
-    
-    @pytest.fixture
-    def mock_docker_service(self):
-        """Create a mock docker service."""
-        service = Mock(spec=DockerEnvironmentService)
-        service.create_container = AsyncMock()
-        service.execute_command = AsyncMock()
-        service.cleanup_container = AsyncMock()
-        return service
-    
-    @pytest.mark.asyncio
+
+    # testing_service and mock_docker_service come from conftest.py:
+    # both are session-built, with mutable state reset per test.
+
     async def test_create_test_environment_success(self, testing_service, mock_docker_service):
         """Test successful test environment creation."""
         # Mock successful container creation
-        mock_container = Mock()
-        mock_container.id = "test_container_123"
-        mock_container.name = "coding-agent-test-env"
-        mock_container.status = "running"
-        
-        mock_docker_service.create_container.return_value = mock_container
+        mock_docker_service.create_container.return_value = _READY_CONTAINER
         testing_service.docker_service = mock_docker_service
         
         # Create test environment
@@ -61,14 +95,14 @@ class TestTestingService:
             target_service="market-predictor"
         )
         
-        # Assertions
-        assert env.task_id == "test_task_123"
-        assert env.target_service == "market-predictor"
-        assert env.container_id == "test_container_123"
-        assert env.status == EnvironmentStatus.READY
+        # Assertions: one structural compare reports every deviating
+        # field at once
+        assert (env.task_id, env.target_service, env.container_id, env.status) == (
+            "test_task_123", "market-predictor", "test_container_123",
+            EnvironmentStatus.READY
+        )
         assert env.env_id in testing_service.active_environments
     
-    @pytest.mark.asyncio
     async def test_create_test_environment_failure(self, testing_service, mock_docker_service):
         """Test test environment creation failure."""
         # Mock container creation failure
@@ -85,7 +119,6 @@ class TestTestingService:
         assert env.status == EnvironmentStatus.FAILED
         assert env.error_message == "Failed to create Docker container"
     
-    @pytest.mark.asyncio
     async def test_install_dependencies_success(self, testing_service, mock_docker_service):
         """Test successful dependency installation."""
         # Create test environment
@@ -96,9 +129,9 @@ class TestTestingService:
             status=EnvironmentStatus.READY
         )
         
-        # Mock successful command execution
-        mock_result = Mock()
-        mock_result.exit_code = 0
+        # Mock successful command execution; the service only reads
+        # attributes off the result, so a plain namespace suffices
+        mock_result = SimpleNamespace(exit_code=0)
         mock_docker_service.execute_command.return_value = mock_result
         testing_service.docker_service = mock_docker_service
         
@@ -110,7 +143,6 @@ class TestTestingService:
         assert env.dependencies_installed is True
         assert env.status == EnvironmentStatus.READY
     
-    @pytest.mark.asyncio
     async def test_install_dependencies_failure(self, testing_service, mock_docker_service):
         """Test dependency installation failure."""
         # Create test environment
@@ -122,9 +154,7 @@ class TestTestingService:
         )
         
         # Mock failed command execution
-        mock_result = Mock()
-        mock_result.exit_code = 1
-        mock_result.stderr = "Package not found"
+        mock_result = SimpleNamespace(exit_code=1, stderr="Package not found")
         mock_docker_service.execute_command.return_value = mock_result
         testing_service.docker_service = mock_docker_service
         
@@ -136,7 +166,6 @@ class TestTestingService:
         assert env.status == EnvironmentStatus.FAILED
         assert "Failed to execute" in env.error_message
     
-    @pytest.mark.asyncio
     async def test_run_test_suite_success(self, testing_service, mock_docker_service):
         """Test successful test suite execution."""
         # Create test environment
@@ -147,23 +176,11 @@ class TestTestingService:
             status=EnvironmentStatus.READY
         )
         
-        # Mock successful test execution
-        mock_exec_result = Mock()
-        mock_exec_result.exit_code = 0
-        mock_exec_result.stdout = "All tests passed"
-        
-        mock_json_result = Mock()
-        mock_json_result.exit_code = 0
-        mock_json_result.stdout = '''
-        {
-            "summary": {"passed": 5, "failed": 0, "skipped": 1},
-            "tests": [
-                {"nodeid": "test_file.py::test_function", "outcome": "passed", "duration": 0.1}
-            ]
-        }
-        '''
-        
-        mock_docker_service.execute_command.side_effect = [mock_exec_result, mock_json_result]
+        # Mock successful test execution: hand out the prebuilt run
+        # and json-report results in order
+        run_results = iter(_TEST_RUN_RESULTS)
+        mock_docker_service.execute_command.side_effect = \
+            lambda *args, **kwargs: next(run_results)
         mock_docker_service.write_file_in_container = AsyncMock(return_value=True)
         testing_service.docker_service = mock_docker_service
         
@@ -183,8 +200,122 @@ class TestTestingService:
         assert results.failed == 0
         assert results.total == 6  # 5 passed + 1 skipped
         assert len(results.test_details) == 1
-    
-    @pytest.mark.asyncio
+
+    async def test_run_test_suite_reads_report_via_archive(self, testing_service, mock_docker_service):
+        """Test that the json report comes through the archive API when
+        get_file works: one exec for the run itself, no cat readback."""
+        env = TestEnvironment(
+            env_id="test_env_archive",
+            task_id="test_task_archive",
+            container_id="container_archive",
+            status=EnvironmentStatus.READY
+        )
+
+        mock_docker_service.execute_command.return_value = _TEST_RUN_RESULTS[0]
+        mock_docker_service.get_file.side_effect = None
+        mock_docker_service.get_file.return_value = json.dumps(_JSON_REPORT).encode("utf-8")
+        mock_docker_service.write_file_in_container = AsyncMock(return_value=True)
+        testing_service.docker_service = mock_docker_service
+
+        test_suite = TestSuite(
+            test_type=TestType.UNIT,
+            test_files={"test_example.py": "def test_example(): assert True"},
+            timeout_seconds=300
+        )
+
+        results = await testing_service.run_test_suite(env, test_suite)
+
+        assert results.success is True
+        assert results.passed == 5
+        assert results.failed == 0
+        assert results.total == 6  # 5 passed + 1 skipped
+        assert len(results.test_details) == 1
+        mock_docker_service.get_file.assert_awaited_once_with(
+            env.container_id, "/tmp/test_results.json"
+        )
+        # Only the pytest run itself goes through execute_command
+        mock_docker_service.execute_command.assert_called_once()
+
+    async def test_run_pytest_streams_output(self, testing_service, mock_docker_service):
+        """Test the streaming path: chunks feed the tail, the trailing
+        CommandResult carries the exit code, and the buffered fallback
+        never runs."""
+        env = TestEnvironment(
+            env_id="test_env_stream",
+            task_id="test_task_stream",
+            container_id="container_stream",
+            status=EnvironmentStatus.READY
+        )
+
+        async def stream(container_id, command, working_dir="/app"):
+            yield b"collected 2 items\n"
+            yield b"2 passed in 0.01s\n"
+            yield CommandResult(exit_code=0, command="pytest")
+
+        mock_docker_service.execute_command_stream.side_effect = stream
+        testing_service.docker_service = mock_docker_service
+
+        result = await testing_service._run_pytest(
+            env, testing_service._UNIT_TEST_CMD, timeout=5
+        )
+
+        assert result.exit_code == 0
+        assert result.stdout == "collected 2 items\n2 passed in 0.01s\n"
+        mock_docker_service.execute_command.assert_not_called()
+
+    async def test_run_pytest_stream_keeps_only_tail(self, testing_service, mock_docker_service):
+        """Test that a verbose run is trimmed to the last
+        _STREAM_TAIL_LIMIT bytes instead of buffered in full."""
+        env = TestEnvironment(
+            env_id="test_env_tail",
+            task_id="test_task_tail",
+            container_id="container_tail",
+            status=EnvironmentStatus.READY
+        )
+        limit = testing_service._STREAM_TAIL_LIMIT
+
+        async def stream(container_id, command, working_dir="/app"):
+            yield b"x" * limit
+            yield b"tail marker"
+            yield CommandResult(exit_code=0, command="pytest")
+
+        mock_docker_service.execute_command_stream.side_effect = stream
+        testing_service.docker_service = mock_docker_service
+
+        result = await testing_service._run_pytest(
+            env, testing_service._UNIT_TEST_CMD, timeout=5
+        )
+
+        assert len(result.stdout) == limit
+        assert result.stdout.endswith("tail marker")
+
+    async def test_run_pytest_stream_timeout(self, testing_service, mock_docker_service):
+        """Test that a stalled stream times out with exit code 124 and
+        keeps the output received so far."""
+        env = TestEnvironment(
+            env_id="test_env_stall",
+            task_id="test_task_stall",
+            container_id="container_stall",
+            status=EnvironmentStatus.READY
+        )
+
+        async def stream(container_id, command, working_dir="/app"):
+            yield b"collecting ..."
+            await asyncio.sleep(30)
+            yield CommandResult(exit_code=0, command="pytest")
+
+        mock_docker_service.execute_command_stream.side_effect = stream
+        testing_service.docker_service = mock_docker_service
+
+        result = await testing_service._run_pytest(
+            env, testing_service._UNIT_TEST_CMD, timeout=0.01
+        )
+
+        assert result.exit_code == 124
+        assert result.stdout == "collecting ..."
+        assert "timed out" in result.stderr
+        mock_docker_service.execute_command.assert_not_called()
+
     async def test_cleanup_environment_success(self, testing_service, mock_docker_service):
         """Test successful environment cleanup."""
         # Create test environment
@@ -202,33 +333,29 @@ class TestTestingService:
         mock_docker_service.cleanup_container.return_value = True
         testing_service.docker_service = mock_docker_service
         
-        # Mock workspace directory exists
+        # Mock workspace directory exists; removal runs through an async
+        # rm -rf subprocess
+        mock_proc = SimpleNamespace(wait=AsyncMock(return_value=0))
         with patch('os.path.exists', return_value=True), \
-             patch('shutil.rmtree') as mock_rmtree:
-            
+             patch('asyncio.create_subprocess_exec', new=AsyncMock(return_value=mock_proc)) as mock_rm:
+
             # Cleanup environment
             success = await testing_service.cleanup_environment(env)
-            
+
             # Assertions
             assert success is True
             assert env.status == EnvironmentStatus.CLEANED_UP
             assert env.env_id not in testing_service.active_environments
-            mock_rmtree.assert_called_once()
+            mock_rm.assert_called_once()
+            assert mock_rm.call_args.args[:2] == ("rm", "-rf")
 
 
 class TestDockerEnvironmentService:
     """Test the Docker environment service."""
-    
-    @pytest.fixture
-    def docker_service(self):
-        """Create a docker service instance for tests."""
-        with patch('docker.from_env') as mock_docker:
-            mock_client = Mock()
-            mock_docker.return_value = mock_client
-            mock_client.ping.return_value = True
-            return DockerEnvironmentService()
-    
-    @pytest.mark.asyncio
+
+    # docker_service comes from conftest.py: session-built against a
+    # mocked docker client, with a fresh client mock per test.
+
     async def test_create_container_success(self, docker_service):
         """Test successful container creation."""
         # Mock container creation
@@ -250,234 +377,178 @@ class TestDockerEnvironmentService:
         assert container.id == "container_abc123"
         assert "container_abc123" in docker_service.active_containers
     
-    @pytest.mark.asyncio
     async def test_execute_command_success(self, docker_service):
         """Test successful command execution."""
-        # Mock container and execution
-        mock_container = Mock()
-        mock_exec_result = Mock()
-        mock_exec_result.exit_code = 0
-        mock_exec_result.output = b"Command output"
-        mock_container.exec_run.return_value = mock_exec_result
-        
-        docker_service.docker_client.containers.get.return_value = mock_container
-        
+        # Mock the low-level exec API
+        mock_api = docker_service.docker_client.api
+        mock_api.exec_create.return_value = {"Id": "exec_123"}
+        mock_api.exec_start.return_value = (b"Command output", None)
+        mock_api.exec_inspect.return_value = {"ExitCode": 0}
+
         # Execute command
         result = await docker_service.execute_command(
             container_id="container_123",
             command="echo 'test'"
         )
-        
+
         # Assertions
         assert result.exit_code == 0
         assert result.stdout == "Command output"
+        assert result.stderr == ""
         assert result.command == "echo 'test'"
-    
-    @pytest.mark.asyncio
+
     async def test_execute_command_timeout(self, docker_service):
         """Test command execution timeout."""
-        # Mock container that hangs
-        mock_container = Mock()
-        
-        def slow_exec(*args, **kwargs):
-            import time
-            time.sleep(10)  # Simulate slow command
-            
-        mock_container.exec_run = slow_exec
-        docker_service.docker_client.containers.get.return_value = mock_container
-        
-        # Execute command with short timeout
-        result = await docker_service.execute_command(
-            container_id="container_123",
-            command="sleep 10",
-            timeout=1
-        )
-        
+        # Mock an exec that hangs until the test releases it — no real
+        # sleep, so the timeout path costs ~10ms instead of a second
+        mock_api = docker_service.docker_client.api
+        mock_api.exec_create.return_value = {"Id": "exec_123"}
+
+        release = threading.Event()
+
+        def hanging_exec(*args, **kwargs):
+            release.wait(5)
+
+        mock_api.exec_start = hanging_exec
+
+        try:
+            # Execute command with short timeout
+            result = await docker_service.execute_command(
+                container_id="container_123",
+                command="sleep 10",
+                timeout=0.01
+            )
+        finally:
+            # Unblock the executor thread immediately
+            release.set()
+
         # Assertions
         assert result.exit_code == 124  # Timeout exit code
         assert "timed out" in result.stderr.lower()
     
-    @pytest.mark.asyncio
     async def test_write_file_in_container(self, docker_service):
         """Test writing file to container."""
-        # Mock container
+        # Mock container; the exec result is attribute-only, the
+        # container itself records put_archive calls
         mock_container = Mock()
-        mock_exec_result = Mock()
-        mock_exec_result.exit_code = 0
-        mock_container.exec_run.return_value = mock_exec_result
+        mock_container.exec_run.return_value = _EXEC_OK
         
         docker_service.docker_client.containers.get.return_value = mock_container
-        
-        # Mock copy_file_to_container method
-        docker_service.copy_file_to_container = AsyncMock(return_value=True)
-        
+
         # Write file
         success = await docker_service.write_file_in_container(
             container_id="container_123",
             file_path="/app/test.py",
             content="print('Hello, World!')"
         )
-        
+
         # Assertions
         assert success is True
-        docker_service.copy_file_to_container.assert_called_once()
+        mock_container.put_archive.assert_called_once()
+
+    async def test_list_active_containers_tracks_removal(self, docker_service):
+        """Test container list stays consistent through swap-removal."""
+        # Create three containers
+        for suffix in ["a", "b", "c"]:
+            mock_container = Mock()
+            mock_container.id = f"container_{suffix}"
+            docker_service.docker_client.containers.run.return_value = mock_container
+            await docker_service.create_container(env_id=f"env_{suffix}")
+
+        containers = docker_service.list_active_containers()
+        assert [c.container_id for c in containers] == [
+            "container_a", "container_b", "container_c"
+        ]
+
+        # Remove the first container; the others must remain listed
+        assert await docker_service.cleanup_container("container_a") is True
+
+        remaining = {c.container_id for c in docker_service.list_active_containers()}
+        assert remaining == {"container_b", "container_c"}
+        assert "container_a" not in docker_service.active_containers
+        assert len(docker_service.list_active_containers()) == len(
+            docker_service.active_containers
+        )
 
 
 class TestWorkflowIntegration:
     """Test integration with the workflow engine."""
-    
-    @pytest.fixture
-    def workflow_engine(self):
-        """Create a workflow engine for testing."""
-        with patch('src.coding_agent.agents.coding_agents.CodingAgentOrchestrator'), \
-             patch('src.coding_agent.services.code_analysis.CodeAnalysisService'), \
-             patch('src.coding_agent.services.git_service.GitService'):
-            return WorkflowEngine()
-    
-    @pytest.mark.asyncio
-    async def test_local_testing_integration(self, workflow_engine):
-        """Test the local testing step integration."""
-        # Create workflow context
-        request = CodingRequest(
-            requirements="Add a comprehensive test endpoint for status monitoring",
-            target_service="market-predictor"
-        )
-        
-        context = WorkflowContext("test_task_integration", request)
-        context.workspace_path = "/tmp/test_workspace"
-        context.code_changes = []  # No code changes for this test
-        
+
+    # workflow_engine comes from conftest.py: a per-test shallow copy
+    # of the session engine, so the orchestrator/analysis/git services
+    # are constructed once instead of patched and rebuilt per test.
+
+    @pytest.mark.parametrize("task_id, env_status, results_kwargs, expected_stats", [
+        ("test_task_integration", "ready",
+         dict(success=True, passed=3, failed=0, total=3, coverage_percentage=95.0),
+         _EXPECTED_TESTING_STATS),
+        ("test_task_failures", "ready",
+         dict(success=False, passed=2, failed=1, total=3, coverage_percentage=75.0),
+         _EXPECTED_FAILURE_STATS),
+        ("test_task_env_failure", "failed", None, None),
+    ], ids=["integration", "with_failures", "environment_failure"])
+    async def test_local_testing(self, workflow_engine, task_id, env_status,
+                                 results_kwargs, expected_stats):
+        """Test the local testing step: clean run, test failures, and
+        environment-creation failure (expected_stats None)."""
+        # Create workflow context from the validated template
+        request = _REQUEST_TEMPLATE.model_copy()
+
+        from src.coding_agent.core.workflow_engine import WorkflowContext
+
+        context = WorkflowContext(task_id, request)
+        if env_status == "ready":
+            context.workspace_path = "/tmp/test_workspace"
+            context.code_changes = []  # No code changes for these tests
+
         # Mock testing service
         with patch('src.coding_agent.services.testing_service.TestingService') as mock_service_class:
             mock_service = Mock()
             mock_service_class.return_value = mock_service
-            
-            # Mock environment creation
-            mock_env = Mock()
-            mock_env.status = "ready"
+
+            # Mock environment creation (and, unless the environment
+            # fails, the rest of the testing lifecycle)
+            mock_env = SimpleNamespace(
+                status=env_status, error_message="Docker not available"
+            )
             mock_service.create_test_environment = AsyncMock(return_value=mock_env)
             mock_service.install_dependencies = AsyncMock(return_value=True)
             mock_service.start_target_service = AsyncMock(return_value=True)
             mock_service.cleanup_environment = AsyncMock(return_value=True)
-            
-            # Mock test execution
-            mock_results = Mock()
-            mock_results.success = True
-            mock_results.passed = 3
-            mock_results.failed = 0
-            mock_results.total = 3
-            mock_results.test_details = []
-            mock_results.coverage_percentage = 95.0
-            mock_service.run_test_suite = AsyncMock(return_value=mock_results)
-            
-            # Execute local testing step
+            if results_kwargs is not None:
+                mock_service.run_test_suite = AsyncMock(
+                    return_value=SimpleNamespace(test_details=[], **results_kwargs)
+                )
+
+            # Execute local testing step; it continues to validation
+            # whatever the testing outcome
             next_state = await workflow_engine._handle_local_testing(context)
-            
-            # Assertions
+
             assert next_state.value == "validation"
-            assert context.statistics.get("testing_completed") is True
-            assert context.statistics.get("tests_passed") == 3
-            assert context.statistics.get("tests_failed") == 0
-            assert context.statistics.get("test_coverage") == 95.0
-    
-    @pytest.mark.asyncio
-    async def test_local_testing_with_failures(self, workflow_engine):
-        """Test local testing step with test failures."""
-        # Create workflow context
-        request = CodingRequest(
-            requirements="Add a comprehensive test endpoint with failure scenarios",
-            target_service="market-predictor"
-        )
-        
-        context = WorkflowContext("test_task_failures", request)
-        context.workspace_path = "/tmp/test_workspace"
-        context.code_changes = []
-        
-        # Mock testing service with failures
-        with patch('src.coding_agent.services.testing_service.TestingService') as mock_service_class:
-            mock_service = Mock()
-            mock_service_class.return_value = mock_service
-            
-            # Mock environment creation
-            mock_env = Mock()
-            mock_env.status = "ready"
-            mock_service.create_test_environment = AsyncMock(return_value=mock_env)
-            mock_service.install_dependencies = AsyncMock(return_value=True)
-            mock_service.cleanup_environment = AsyncMock(return_value=True)
-            
-            # Mock test execution with failures
-            mock_results = Mock()
-            mock_results.success = False
-            mock_results.passed = 2
-            mock_results.failed = 1
-            mock_results.total = 3
-            mock_results.test_details = []
-            mock_results.coverage_percentage = 75.0
-            mock_service.run_test_suite = AsyncMock(return_value=mock_results)
-            
-            # Execute local testing step
-            next_state = await workflow_engine._handle_local_testing(context)
-            
-            # Assertions
-            assert next_state.value == "validation"  # Should continue despite failures
-            assert context.statistics.get("testing_completed") is True
-            assert context.statistics.get("tests_passed") == 2
-            assert context.statistics.get("tests_failed") == 1
-            assert context.statistics.get("test_failures_ignored") is True
-    
-    @pytest.mark.asyncio
-    async def test_local_testing_environment_failure(self, workflow_engine):
-        """Test local testing with environment creation failure."""
-        # Create workflow context
-        request = CodingRequest(
-            requirements="Add a comprehensive test endpoint for environment failure testing",
-            target_service="market-predictor"
-        )
-        
-        context = WorkflowContext("test_task_env_failure", request)
-        
-        # Mock testing service with environment failure
-        with patch('src.coding_agent.services.testing_service.TestingService') as mock_service_class:
-            mock_service = Mock()
-            mock_service_class.return_value = mock_service
-            
-            # Mock environment creation failure
-            mock_env = Mock()
-            mock_env.status = "failed"
-            mock_env.error_message = "Docker not available"
-            mock_service.create_test_environment = AsyncMock(return_value=mock_env)
-            
-            # Execute local testing step
-            next_state = await workflow_engine._handle_local_testing(context)
-            
-            # Assertions
-            assert next_state.value == "validation"  # Should continue despite failure
-            assert context.statistics.get("testing_failed") is True
-            assert "Docker not available" in context.statistics.get("testing_error", "")
+            if expected_stats is not None:
+                assert {
+                    k: context.statistics.get(k) for k in expected_stats
+                } == expected_stats
+            else:
+                assert context.statistics.get("testing_failed") is True
+                assert "Docker not available" in context.statistics.get("testing_error", "")
 
 
 class TestEndToEndTestingWorkflow:
     """End-to-end testing workflow tests."""
     
-    @pytest.mark.asyncio
     @pytest.mark.integration
-    async def test_complete_testing_workflow(self):
+    async def test_complete_testing_workflow(self, docker_available):
         """Test complete testing workflow from creation to cleanup."""
-        # This test requires Docker to be available
-        # Skip if Docker is not available
-        try:
-            import docker
-            client = docker.from_env()
-            client.ping()
-        except Exception:
+        # This test requires Docker; the probe result is session-cached
+        if not docker_available:
             pytest.skip("Docker not available for integration test")
-        
+
         # Create testing service
+        from src.coding_agent.services.testing_service import TestingService
+
         testing_service = TestingService()
-        
-        if not testing_service.docker_service.is_docker_available():
-            pytest.skip("Docker service not available")
-        
+
         # Test environment creation
         env = await testing_service.create_test_environment(
             task_id="integration_test_123",
@@ -521,10 +592,12 @@ def test_addition():
     
     def test_generate_basic_test_suite(self):
         """Test basic test suite generation."""
+        from src.coding_agent.core.workflow_engine import WorkflowEngine, WorkflowContext
+
         workflow_engine = WorkflowEngine()
-        
-        # Create minimal context
-        request = CodingRequest(requirements="Test basic functionality with comprehensive validation")
+
+        # Create minimal context from the validated template
+        request = _REQUEST_TEMPLATE.model_copy()
         context = WorkflowContext("test_basic_suite", request)
         
         # Generate test suite
@@ -535,7 +608,4 @@ def test_addition():
         assert "def test_implementation_exists" in test_content
         assert "class TestGeneratedCode" in test_content
         assert "Auto-generated by Coding AI Agent" in test_content
-
-
-# Test configuration
-pytest_plugins = ["pytest_asyncio"] 
\ No newline at end of file
+ 
\ No newline at end of file